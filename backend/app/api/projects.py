@@ -333,9 +333,12 @@ async def run_optimization(
             gltf_output = ProjectOutput(
                 project_id=project_id,
                 output_type=OutputType.GLTF,
-                filename="optimized.gltf",
+                filename=os.path.basename(gltf_url),
                 file_path=gltf_url,
-                mime_type="model/gltf+json",
+                mime_type=(
+                    "model/gltf-binary" if gltf_url.endswith(".glb")
+                    else "model/gltf+json"
+                ),
                 output_metadata={"generated_by": "optimization_pipeline"}
             )
             db.add(gltf_output)
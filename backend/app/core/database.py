@@ -1,5 +1,6 @@
 """Database configuration and session management."""
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -7,10 +8,20 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON columns with orjson, writing NumPy arrays directly."""
+    return orjson.dumps(
+        obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 async_session_maker = sessionmaker(
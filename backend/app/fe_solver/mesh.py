@@ -82,23 +82,17 @@ class MeshGenerator:
         X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
         nodes = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
 
-        # Generate hexahedral elements
-        elements = []
-        for i in range(nx):
-            for j in range(ny):
-                for k in range(nz):
-                    # Node indices for hex8 element
-                    n0 = i * (ny + 1) * (nz + 1) + j * (nz + 1) + k
-                    n1 = (i + 1) * (ny + 1) * (nz + 1) + j * (nz + 1) + k
-                    n2 = (i + 1) * (ny + 1) * (nz + 1) + (j + 1) * (nz + 1) + k
-                    n3 = i * (ny + 1) * (nz + 1) + (j + 1) * (nz + 1) + k
-                    n4 = n0 + 1
-                    n5 = n1 + 1
-                    n6 = n2 + 1
-                    n7 = n3 + 1
-                    elements.append([n0, n1, n2, n3, n4, n5, n6, n7])
-
-        elements = np.array(elements)
+        # Generate hexahedral elements: the node index of each element's
+        # first corner plus the fixed offsets of its eight hex8 corners
+        stride_i = (ny + 1) * (nz + 1)
+        stride_j = nz + 1
+        first = (
+            np.arange(nx)[:, None, None] * stride_i
+            + np.arange(ny)[None, :, None] * stride_j
+            + np.arange(nz)[None, None, :]
+        ).ravel()
+        corners = np.array([0, stride_i, stride_i + stride_j, stride_j])
+        elements = first[:, None] + np.concatenate([corners, corners + 1])
 
         # Identify boundary nodes
         boundary_nodes = {
@@ -184,31 +178,30 @@ class MeshGenerator:
         """Export mesh in VTK format."""
         filepath = f"{filename}.vtk"
 
+        n_nodes = len(mesh.nodes)
+        n_elements = len(mesh.elements)
+        nodes_per_elem = mesh.elements.shape[1]
+        total_size = n_elements * (nodes_per_elem + 1)
+        cell_type = 12 if mesh.element_type == "hex" else 10  # VTK_HEXAHEDRON or VTK_TETRA
+
+        # Each section is one %-template repeated per row and filled in a
+        # single formatting pass, then written with one call
+        element_row = f"{nodes_per_elem} " + " ".join(["%d"] * nodes_per_elem) + "\n"
+        content = "".join([
+            "# vtk DataFile Version 3.0\n",
+            "Mesh\n",
+            "ASCII\n",
+            "DATASET UNSTRUCTURED_GRID\n",
+            f"POINTS {n_nodes} double\n",
+            ("%r %r %r\n" * n_nodes) % tuple(mesh.nodes.ravel().tolist()),
+            f"CELLS {n_elements} {total_size}\n",
+            (element_row * n_elements) % tuple(mesh.elements.ravel().tolist()),
+            f"CELL_TYPES {n_elements}\n",
+            f"{cell_type}\n" * n_elements,
+        ])
+
         with open(filepath, "w") as f:
-            f.write("# vtk DataFile Version 3.0\n")
-            f.write("Mesh\n")
-            f.write("ASCII\n")
-            f.write("DATASET UNSTRUCTURED_GRID\n")
-
-            # Write nodes
-            n_nodes = len(mesh.nodes)
-            f.write(f"POINTS {n_nodes} double\n")
-            for node in mesh.nodes:
-                f.write(f"{node[0]} {node[1]} {node[2]}\n")
-
-            # Write elements
-            n_elements = len(mesh.elements)
-            nodes_per_elem = mesh.elements.shape[1]
-            total_size = n_elements * (nodes_per_elem + 1)
-            f.write(f"CELLS {n_elements} {total_size}\n")
-            for elem in mesh.elements:
-                f.write(f"{nodes_per_elem} " + " ".join(map(str, elem)) + "\n")
-
-            # Write cell types
-            f.write(f"CELL_TYPES {n_elements}\n")
-            cell_type = 12 if mesh.element_type == "hex" else 10  # VTK_HEXAHEDRON or VTK_TETRA
-            for _ in range(n_elements):
-                f.write(f"{cell_type}\n")
+            f.write(content)
 
         return filepath
 
@@ -222,31 +215,31 @@ class MeshGenerator:
         """Export mesh in Abaqus INP format."""
         filepath = f"{filename}.inp"
 
+        n_nodes = len(mesh.nodes)
+        n_elements = len(mesh.elements)
+        elem_type = "C3D8" if mesh.element_type == "hex" else "C3D4"
+
+        # Rows are 1-based ids followed by coordinates or node ids
+        node_rows = [[i, *node] for i, node in enumerate(mesh.nodes.tolist(), 1)]
+        element_rows = np.column_stack([np.arange(1, n_elements + 1), mesh.elements + 1])
+        element_row = ", ".join(["%d"] * element_rows.shape[1]) + "\n"
+
+        parts = [
+            "*HEADING\n",
+            "Mesh generated by Trophy Truck Optimizer\n",
+            "*NODE\n",
+            ("%d, %r, %r, %r\n" * n_nodes) % tuple(v for row in node_rows for v in row),
+            f"*ELEMENT, TYPE={elem_type}\n",
+            (element_row * n_elements) % tuple(element_rows.ravel().tolist()),
+        ]
+
+        # Node sets for boundaries, ten ids per line
+        for name, node_ids in mesh.boundary_nodes.items():
+            ids = [str(nid + 1) for nid in node_ids]
+            lines = [", ".join(ids[j:j + 10]) for j in range(0, len(ids), 10)]
+            parts.append(f"*NSET, NSET={name}\n" + ", \n".join(lines) + "\n")
+
         with open(filepath, "w") as f:
-            f.write("*HEADING\n")
-            f.write("Mesh generated by Trophy Truck Optimizer\n")
-
-            # Write nodes
-            f.write("*NODE\n")
-            for i, node in enumerate(mesh.nodes):
-                f.write(f"{i + 1}, {node[0]}, {node[1]}, {node[2]}\n")
-
-            # Write elements
-            elem_type = "C3D8" if mesh.element_type == "hex" else "C3D4"
-            f.write(f"*ELEMENT, TYPE={elem_type}\n")
-            for i, elem in enumerate(mesh.elements):
-                elem_str = ", ".join(str(n + 1) for n in elem)
-                f.write(f"{i + 1}, {elem_str}\n")
-
-            # Write node sets for boundaries
-            for name, node_ids in mesh.boundary_nodes.items():
-                f.write(f"*NSET, NSET={name}\n")
-                for j, nid in enumerate(node_ids):
-                    if j > 0 and j % 10 == 0:
-                        f.write("\n")
-                    f.write(f"{nid + 1}")
-                    if j < len(node_ids) - 1:
-                        f.write(", ")
-                f.write("\n")
+            f.write("".join(parts))
 
         return filepath
@@ -7,10 +7,11 @@ from typing import Any, Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.materials import router as materials_router
+from app.api.projects import orchestrator
 from app.api.projects import router as projects_router
 from app.api.rules import router as rules_router
 from app.core.config import get_settings
@@ -26,7 +27,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     # Shutdown
-    pass
+    orchestrator.shutdown()
 
 
 app = FastAPI(
@@ -45,6 +46,7 @@ app = FastAPI(
     - Generating CAD exports and reports
     """,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -16,6 +16,10 @@ class ValidationSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Severities that make a design fail validation
+_BLOCKING_SEVERITIES = frozenset({ValidationSeverity.ERROR, ValidationSeverity.CRITICAL})
+
+
 @dataclass
 class ManufacturingViolation:
     """A manufacturing constraint violation."""
@@ -227,7 +231,7 @@ class ManufacturingValidator:
                     )
                 )
 
-        is_valid = not any(v.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL] for v in violations)
+        is_valid = not any(v.severity in _BLOCKING_SEVERITIES for v in violations)
         return is_valid, violations
 
     def analyze_drapability(
@@ -373,7 +377,7 @@ class ManufacturingValidator:
                     )
                 )
 
-        is_valid = not any(v.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL] for v in violations)
+        is_valid = not any(v.severity in _BLOCKING_SEVERITIES for v in violations)
         return is_valid, violations
 
     def validate_adhesive_bonds(
@@ -417,7 +421,7 @@ class ManufacturingValidator:
                     )
                 )
 
-        is_valid = not any(v.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL] for v in violations)
+        is_valid = not any(v.severity in _BLOCKING_SEVERITIES for v in violations)
         return is_valid, violations
 
     def generate_full_report(
@@ -478,11 +482,9 @@ class ManufacturingValidator:
             bond_valid = True
             bond_violations = []
 
-        # Overall validity
-        is_valid = not any(
-            v.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]
-            for v in all_violations
-        )
+        # Overall validity: every check already reported its own; the only
+        # violation not covered by one is the drapability error
+        is_valid = bool(layup_valid and drapability.is_drapeable and insert_valid and bond_valid)
 
         return ManufacturingReport(
             is_valid=is_valid,
@@ -1,7 +1,7 @@
 """Orthotropic laminate model for composite materials."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -57,6 +57,17 @@ class LaminateAnalyzer:
         self.total_thickness = sum(p.thickness for p in plies)
         self.z_coords = self._compute_z_coordinates()
 
+        # Per-ply angles and local stiffness, stacked for batched CLT
+        self.angles = np.array([ply.angle for ply in plies], dtype=float)
+        self.thicknesses = np.array([ply.thickness for ply in plies], dtype=float)
+        self.Q_local = np.array(
+            [self._ply_stiffness_local(ply) for ply in plies]
+        ).reshape(-1, 3, 3)
+        self.Q_bar = self._unique_ply_stiffness_global()
+        self.strengths = np.array(
+            [[ply.xt, ply.xc, ply.yt, ply.yc, ply.s12] for ply in plies], dtype=float
+        ).reshape(-1, 5)
+
     def _compute_z_coordinates(self) -> List[float]:
         """Compute z-coordinates of ply interfaces from midplane."""
         z = [-self.total_thickness / 2]
@@ -64,8 +75,11 @@ class LaminateAnalyzer:
             z.append(z[-1] + ply.thickness)
         return z
 
-    def _rotation_matrix(self, angle_deg: float) -> np.ndarray:
-        """Compute stress transformation matrix for rotation."""
+    def _rotation_matrix(self, angle_deg: Union[float, np.ndarray]) -> np.ndarray:
+        """Compute stress transformation matrix for rotation.
+
+        An array of angles gives a stacked (N, 3, 3) array of matrices.
+        """
         theta = np.radians(angle_deg)
         c = np.cos(theta)
         s = np.sin(theta)
@@ -77,10 +91,13 @@ class LaminateAnalyzer:
                 [-c * s, c * s, c ** 2 - s ** 2],
             ]
         )
-        return T
+        return np.moveaxis(T, (0, 1), (-2, -1))
 
-    def _rotation_matrix_strain(self, angle_deg: float) -> np.ndarray:
-        """Compute strain transformation matrix for rotation."""
+    def _rotation_matrix_strain(self, angle_deg: Union[float, np.ndarray]) -> np.ndarray:
+        """Compute strain transformation matrix for rotation.
+
+        An array of angles gives a stacked (N, 3, 3) array of matrices.
+        """
         theta = np.radians(angle_deg)
         c = np.cos(theta)
         s = np.sin(theta)
@@ -92,7 +109,7 @@ class LaminateAnalyzer:
                 [-2 * c * s, 2 * c * s, c ** 2 - s ** 2],
             ]
         )
-        return T
+        return np.moveaxis(T, (0, 1), (-2, -1))
 
     def _ply_stiffness_local(self, ply: Ply) -> np.ndarray:
         """Compute ply stiffness matrix in local coordinates (Q)."""
@@ -113,33 +130,61 @@ class LaminateAnalyzer:
         )
         return Q
 
-    def _ply_stiffness_global(self, ply: Ply) -> np.ndarray:
-        """Compute ply stiffness matrix in global coordinates (Q_bar)."""
-        Q = self._ply_stiffness_local(ply)
-        T = self._rotation_matrix(ply.angle)
-        T_inv = np.linalg.inv(T)
-        
-        # Reuter matrix for engineering strain conversion
-        R = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 2]])
-        R_inv = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 0.5]])
+    def _ply_stiffness_global(
+        self, Q: np.ndarray, angle_deg: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Compute ply stiffness matrix in global coordinates (Q_bar).
+
+        Q and angle_deg may be stacked over plies ((N, 3, 3) and (N,)).
+        """
+        theta = np.radians(angle_deg)
+        c = np.cos(theta)
+        s = np.sin(theta)
+        c2, s2, cs = c * c, s * s, c * s
 
-        Q_bar = T_inv @ Q @ R_inv @ T @ R
+        Q11, Q12, Q22, Q66 = Q[..., 0, 0], Q[..., 0, 1], Q[..., 1, 1], Q[..., 2, 2]
+
+        # Closed-form rotated stiffness (Tsai-Hahn)
+        Q11b = Q11 * c2 * c2 + 2 * (Q12 + 2 * Q66) * c2 * s2 + Q22 * s2 * s2
+        Q22b = Q11 * s2 * s2 + 2 * (Q12 + 2 * Q66) * c2 * s2 + Q22 * c2 * c2
+        Q12b = (Q11 + Q22 - 4 * Q66) * c2 * s2 + Q12 * (c2 * c2 + s2 * s2)
+        Q66b = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * c2 * s2 + Q66 * (c2 * c2 + s2 * s2)
+        Q16b = (Q11 - Q12 - 2 * Q66) * c2 * cs + (Q12 - Q22 + 2 * Q66) * s2 * cs
+        Q26b = (Q11 - Q12 - 2 * Q66) * s2 * cs + (Q12 - Q22 + 2 * Q66) * c2 * cs
+
+        Q_bar = np.array(
+            [
+                [Q11b, Q12b, Q16b],
+                [Q12b, Q22b, Q26b],
+                [Q16b, Q26b, Q66b],
+            ]
+        )
+        Q_bar = np.moveaxis(Q_bar, (0, 1), (-2, -1))
+        return Q_bar
+
+    def _unique_ply_stiffness_global(self) -> np.ndarray:
+        """Compute Q_bar for every ply, rotating each distinct
+        (stiffness, angle) combination only once.
+
+        Layups repeat a handful of angles, so most plies share a result.
+        The returned array is read-only.
+        """
+        keys = np.column_stack([self.angles, self.Q_local.reshape(-1, 9)])
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        Q_bar = self._ply_stiffness_global(
+            unique[:, 1:].reshape(-1, 3, 3), unique[:, 0]
+        )[inverse.reshape(-1)]
+        Q_bar.flags.writeable = False
         return Q_bar
 
     def compute_abd_matrix(self) -> np.ndarray:
         """Compute the ABD stiffness matrix."""
-        A = np.zeros((3, 3))
-        B = np.zeros((3, 3))
-        D = np.zeros((3, 3))
-
-        for i, ply in enumerate(self.plies):
-            Q_bar = self._ply_stiffness_global(ply)
-            z_k = self.z_coords[i + 1]
-            z_k_1 = self.z_coords[i]
+        Q_bar = self.Q_bar
+        z = np.asarray(self.z_coords)
 
-            A += Q_bar * (z_k - z_k_1)
-            B += Q_bar * (z_k ** 2 - z_k_1 ** 2) / 2
-            D += Q_bar * (z_k ** 3 - z_k_1 ** 3) / 3
+        A = np.einsum("nij,n->ij", Q_bar, np.diff(z))
+        B = np.einsum("nij,n->ij", Q_bar, np.diff(z ** 2) / 2)
+        D = np.einsum("nij,n->ij", Q_bar, np.diff(z ** 3) / 3)
 
         # Assemble ABD matrix
         ABD = np.zeros((6, 6))
@@ -213,50 +258,46 @@ class LaminateAnalyzer:
         eps0 = eps_kappa[:3]  # Mid-plane strains
         kappa = eps_kappa[3:]  # Curvatures
 
-        ply_stresses = []
-        ply_strains = []
-        failure_indices = []
+        # Strains at each ply mid-plane (global, then local coordinates)
+        z = np.asarray(self.z_coords)
+        z_mid = (z[:-1] + z[1:]) / 2
+        eps_global = eps0 + z_mid[:, None] * kappa
+        T_strain = self._rotation_matrix_strain(self.angles)
+        eps_local = np.einsum("nij,nj->ni", T_strain, eps_global)
 
-        for i, ply in enumerate(self.plies):
-            # Z-coordinate at ply mid-plane
-            z_mid = (self.z_coords[i] + self.z_coords[i + 1]) / 2
+        # Stresses in local coordinates
+        sigma_local = np.einsum("nij,nj->ni", self.Q_local, eps_local)
 
-            # Strain at ply mid-plane (global coordinates)
-            eps_global = eps0 + z_mid * kappa
+        result.ply_stresses = list(sigma_local)
+        result.ply_strains = list(eps_local)
+        result.failure_indices = self.check_failure(sigma_local).tolist()
 
-            # Transform to local coordinates
-            T_strain = self._rotation_matrix_strain(ply.angle)
-            eps_local = T_strain @ eps_global
-
-            # Stress in local coordinates
-            Q_local = self._ply_stiffness_local(ply)
-            sigma_local = Q_local @ eps_local
-
-            ply_strains.append(eps_local)
-            ply_stresses.append(sigma_local)
-
-            # Failure index using Tsai-Hill criterion
-            sigma_1, sigma_2, tau_12 = sigma_local
-
-            # Select appropriate strength based on sign
-            X = ply.xt if sigma_1 >= 0 else ply.xc
-            Y = ply.yt if sigma_2 >= 0 else ply.yc
-            S = ply.s12
+        return result
 
-            # Tsai-Hill failure index
-            FI = (
-                (sigma_1 / X) ** 2
-                - (sigma_1 * sigma_2) / (X ** 2)
-                + (sigma_2 / Y) ** 2
-                + (tau_12 / S) ** 2
-            )
-            failure_indices.append(np.sqrt(FI))
+    def check_failure(self, sigma_local: np.ndarray) -> np.ndarray:
+        """Compute Tsai-Hill failure indices of local ply stresses.
 
-        result.ply_stresses = ply_stresses
-        result.ply_strains = ply_strains
-        result.failure_indices = failure_indices
+        Args:
+            sigma_local: (sigma_1, sigma_2, tau_12) per ply, shape (..., n_plies, 3),
+                e.g. one row of ply stresses per load case or element
 
-        return result
+        Returns:
+            Failure indices, shape (..., n_plies)
+        """
+        sigma_1, sigma_2, tau_12 = np.moveaxis(np.asarray(sigma_local), -1, 0)
+        xt, xc, yt, yc, s12 = self.strengths.T
+
+        # Select appropriate strength based on sign
+        X = np.where(sigma_1 >= 0, xt, xc)
+        Y = np.where(sigma_2 >= 0, yt, yc)
+
+        FI = (
+            (sigma_1 / X) ** 2
+            - (sigma_1 * sigma_2) / (X ** 2)
+            + (sigma_2 / Y) ** 2
+            + (tau_12 / s12) ** 2
+        )
+        return np.sqrt(FI)
 
     def check_ply_rules(self) -> List[Tuple[str, bool, str]]:
         """Check laminate against standard manufacturing rules.
@@ -265,46 +306,42 @@ class LaminateAnalyzer:
             List of (rule_name, passed, message) tuples
         """
         checks = []
+        angles = self.angles
+        folded = np.mod(angles, 180)
 
         # Check 1: Symmetry
-        n = len(self.plies)
-        is_symmetric = True
-        for i in range(n // 2):
-            if abs(self.plies[i].angle - self.plies[n - 1 - i].angle) > 0.1:
-                is_symmetric = False
-                break
+        n = len(angles)
+        is_symmetric = bool(
+            np.all(np.abs(angles[: n // 2] - angles[::-1][: n // 2]) <= 0.1)
+        )
         checks.append(
             ("Symmetry", is_symmetric, 
              "Laminate is symmetric" if is_symmetric else "Laminate is NOT symmetric")
         )
 
-        # Check 2: Balance (equal +θ and -θ plies)
-        angle_counts = {}
-        for ply in self.plies:
-            angle = ply.angle % 180
-            if angle not in [0, 90]:
-                angle_counts[angle] = angle_counts.get(angle, 0) + 1
-                angle_counts[180 - angle] = angle_counts.get(180 - angle, 0) + 1
-
-        is_balanced = all(
-            angle_counts.get(a, 0) == angle_counts.get(180 - a, 0)
-            for a in angle_counts.keys()
-            if a < 90
+        # Check 2: Balance (equal +θ and -θ plies): off-axis plies count +1 at
+        # θ and -1 at 180 - θ, and every angle pair must sum to zero
+        off_axis = folded[(folded != 0) & (folded != 90)]
+        pairs, pair_index = np.unique(
+            np.minimum(off_axis, 180 - off_axis), return_inverse=True
         )
+        imbalance = np.bincount(
+            pair_index.reshape(-1),
+            weights=np.where(off_axis < 90, 1, -1),
+            minlength=len(pairs),
+        )
+        is_balanced = bool(np.all(imbalance == 0))
         checks.append(
             ("Balance", is_balanced,
              "Laminate is balanced" if is_balanced else "Laminate is NOT balanced")
         )
 
-        # Check 3: Maximum consecutive same-angle plies
-        max_consecutive = 1
-        current_consecutive = 1
-        for i in range(1, len(self.plies)):
-            if abs(self.plies[i].angle - self.plies[i - 1].angle) < 0.1:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 1
+        # Check 3: Maximum consecutive same-angle plies, from the lengths of
+        # runs of equal neighbours
+        same = np.abs(np.diff(angles)) < 0.1
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], same.astype(int), [0]])))
+        runs = edges[1::2] - edges[::2]
+        max_consecutive = 1 + int(runs.max(initial=0))
 
         max_allowed = 4
         consecutive_ok = max_consecutive <= max_allowed
@@ -314,27 +351,17 @@ class LaminateAnalyzer:
         )
 
         # Check 4: 10% rule (at least 10% in each direction)
-        angle_fractions = {}
-        total_thickness = self.total_thickness
-        for ply in self.plies:
-            angle = ply.angle % 180
-            # Group angles: 0, 90, +45/-45
-            if angle < 10 or angle > 170:
-                key = "0"
-            elif 80 < angle < 100:
-                key = "90"
-            else:
-                key = "45"
-            angle_fractions[key] = angle_fractions.get(key, 0) + ply.thickness
+        # Group angles: 0, 90, +45/-45
+        directions = ["0", "90", "45"]
+        group = np.select(
+            [(folded < 10) | (folded > 170), (folded > 80) & (folded < 100)], [0, 1], 2
+        )
+        fractions = np.bincount(group, weights=self.thicknesses, minlength=3) / self.total_thickness
 
         min_fraction = 0.10
-        ten_percent_ok = all(
-            angle_fractions.get(d, 0) / total_thickness >= min_fraction
-            for d in ["0", "90", "45"]
-        )
+        ten_percent_ok = bool(np.all(fractions >= min_fraction))
         fractions_str = ", ".join(
-            f"{d}°: {angle_fractions.get(d, 0) / total_thickness * 100:.1f}%"
-            for d in ["0", "90", "45"]
+            f"{d}°: {fraction * 100:.1f}%" for d, fraction in zip(directions, fractions)
         )
         checks.append(
             ("10% Rule", ten_percent_ok,
@@ -364,36 +391,21 @@ def create_quasi_isotropic_layup(
     Returns:
         List of plies for a symmetric, balanced quasi-isotropic laminate
     """
-    angles = [0, 45, -45, 90]
-    plies = []
-
-    # Build first half
-    for _ in range(n_sets):
-        for angle in angles:
-            plies.append(
-                Ply(
-                    material_name=material_name,
-                    angle=angle,
-                    thickness=ply_thickness,
-                    e1=e1,
-                    e2=e2,
-                    g12=g12,
-                    nu12=nu12,
-                )
-            )
-
-    # Add symmetric half
-    for ply in reversed(plies):
-        plies.append(
-            Ply(
-                material_name=ply.material_name,
-                angle=ply.angle,
-                thickness=ply.thickness,
-                e1=ply.e1,
-                e2=ply.e2,
-                g12=ply.g12,
-                nu12=ply.nu12,
-            )
+    # [0/45/-45/90]n followed by its mirror image
+    half = [0, 45, -45, 90] * n_sets
+    angles = half + half[::-1]
+
+    plies = [
+        Ply(
+            material_name=material_name,
+            angle=angle,
+            thickness=ply_thickness,
+            e1=e1,
+            e2=e2,
+            g12=g12,
+            nu12=nu12,
         )
+        for angle in angles
+    ]
 
     return plies
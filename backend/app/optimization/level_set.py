@@ -5,7 +5,7 @@ from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy import ndimage
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, csr_matrix, diags
 from scipy.sparse.linalg import spsolve
 
 
@@ -68,6 +68,9 @@ class LevelSetOptimizer:
         # Build sparse stiffness matrix indices
         self.iK, self.jK = self._build_sparse_indices()
 
+        # Build node/element averaging operators
+        self.node_average, self.element_average = self._build_averaging_operators()
+
     def _initialize_phi(self) -> np.ndarray:
         """Initialize level-set function with circular holes pattern."""
         x = np.linspace(0, self.nelx, self.nelx + 1)
@@ -110,19 +113,33 @@ class LevelSetOptimizer:
         delta[mask] = 1 / (2 * eps) + np.cos(np.pi * phi[mask] / eps) / (2 * eps)
         return delta
 
+    def _build_averaging_operators(self) -> Tuple[csr_matrix, csr_matrix]:
+        """Build sparse operators averaging element values onto nodes and
+        nodal values onto elements."""
+        n_nodes = (self.nelx + 1) * (self.nely + 1)
+        n_elements = self.nelx * self.nely
+
+        # Corner nodes of each element, in element order
+        i, j = np.meshgrid(np.arange(self.nelx), np.arange(self.nely), indexing="ij")
+        n1 = (i * (self.nely + 1) + j).ravel()
+        corners = np.stack([n1, n1 + self.nely + 1, n1 + 1, n1 + self.nely + 2], axis=1)
+
+        incidence = csr_matrix(
+            (np.ones(corners.size), (corners.ravel(), np.repeat(np.arange(n_elements), 4))),
+            shape=(n_nodes, n_elements),
+        )
+        count = np.asarray(incidence.sum(axis=1)).ravel()
+        node_average = diags(1 / count) @ incidence
+        element_average = (0.25 * incidence.T).tocsr()
+        return node_average.tocsr(), element_average
+
     def _phi_to_density(self, phi: np.ndarray) -> np.ndarray:
         """Convert level-set function to element densities."""
         # Average nodal values to get element values
-        phi_elem = np.zeros((self.nelx, self.nely))
-        for i in range(self.nelx):
-            for j in range(self.nely):
-                phi_elem[i, j] = 0.25 * (
-                    phi[i, j] + phi[i + 1, j] + phi[i, j + 1] + phi[i + 1, j + 1]
-                )
+        phi_elem = self.element_average @ phi.ravel()
         
         # Apply Heaviside to get density
-        H = self._heaviside(phi_elem)
-        return H.flatten()
+        return self._heaviside(phi_elem)
 
     def _element_stiffness_matrix(self) -> np.ndarray:
         """Compute element stiffness matrix (plane stress)."""
@@ -206,29 +223,10 @@ class LevelSetOptimizer:
         # Shape sensitivity on the interface
         # V_n = -(compliance sensitivity) + lagrange * (volume sensitivity)
         
-        # Map element sensitivities to nodes
-        velocity = np.zeros((self.nelx + 1, self.nely + 1))
-        count = np.zeros((self.nelx + 1, self.nely + 1))
-        
-        for i in range(self.nelx):
-            for j in range(self.nely):
-                el = i * self.nely + j
-                # Compliance sensitivity
-                dc = -(self.E0 - self.Emin) * ce[el]
-                # Combined velocity
-                v = dc + lagrange
-                
-                # Distribute to corner nodes
-                velocity[i, j] += v
-                velocity[i + 1, j] += v
-                velocity[i, j + 1] += v
-                velocity[i + 1, j + 1] += v
-                count[i, j] += 1
-                count[i + 1, j] += 1
-                count[i, j + 1] += 1
-                count[i + 1, j + 1] += 1
-        
-        velocity = velocity / np.maximum(count, 1)
+        # Compliance sensitivity combined into the element velocity, then
+        # averaged onto the corner nodes
+        v = -(self.E0 - self.Emin) * ce + lagrange
+        velocity = (self.node_average @ v).reshape(self.nelx + 1, self.nely + 1)
         
         # Normalize velocity
         max_vel = np.max(np.abs(velocity))
@@ -316,12 +314,20 @@ class LevelSetOptimizer:
         # Free DOFs
         all_dofs = np.arange(ndof)
         free_dofs = np.setdiff1d(all_dofs, fixed_dofs)
+        f_f = force[free_dofs]
+        
+        # Loop-invariant settings
+        tol = self.config.convergence_tolerance
+        max_iterations = self.config.max_iterations
+        volume_target = self.config.volume_fraction
+        dt = self.config.dt
+        reinit_interval = self.config.reinit_interval
         
         convergence_history = []
         loop = 0
         change = 1.0
         
-        while change > self.config.convergence_tolerance and loop < self.config.max_iterations:
+        while change > tol and loop < max_iterations:
             loop += 1
             
             # Get densities from level-set
@@ -331,21 +337,17 @@ class LevelSetOptimizer:
             K = self._assemble_stiffness(x)
             u = np.zeros(ndof)
             K_ff = K[free_dofs, :][:, free_dofs]
-            f_f = force[free_dofs]
             u[free_dofs] = spsolve(K_ff, f_f)
             
             # Compute compliance
-            ce = np.zeros(n_elements)
-            for el in range(n_elements):
-                Ue = u[self.edofMat[el, :]]
-                ce[el] = Ue @ self.KE @ Ue
+            Ue = u[self.edofMat]
+            ce = np.einsum("ij,jk,ik->i", Ue, self.KE, Ue)
             
             compliance = np.sum((self.Emin + x * (self.E0 - self.Emin)) * ce)
             convergence_history.append(compliance)
             
             # Compute Lagrange multiplier for volume constraint
             current_volume = x.sum() / n_elements
-            volume_target = self.config.volume_fraction
             lagrange = 0.0
             
             # Simple bisection to find lagrange multiplier
@@ -360,10 +362,10 @@ class LevelSetOptimizer:
             # Evolve level-set with Hamilton-Jacobi
             grad = self._upwind_gradient(phi, velocity)
             phi_old = phi.copy()
-            phi = phi - self.config.dt * velocity * grad
+            phi = phi - dt * velocity * grad
             
             # Reinitialize periodically
-            if loop % self.config.reinit_interval == 0:
+            if loop % reinit_interval == 0:
                 phi = self._reinitialize(phi)
             
             # Compute change
@@ -381,7 +383,7 @@ class LevelSetOptimizer:
             compliance=convergence_history[-1] if convergence_history else 0,
             volume_fraction=x.sum() / n_elements,
             iterations=loop,
-            converged=change <= self.config.convergence_tolerance,
+            converged=change <= tol,
             convergence_history=convergence_history,
         )
 
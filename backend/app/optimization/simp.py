@@ -5,8 +5,8 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy import ndimage
-from scipy.sparse import csc_matrix, lil_matrix
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import coo_matrix, csr_matrix, diags, lil_matrix
+from scipy.sparse.linalg import cg, spsolve
 
 
 @dataclass
@@ -25,6 +25,14 @@ class SIMPConfig:
     youngs_modulus: float = 1.0
     poissons_ratio: float = 0.3
     min_density: float = 1e-3
+    linear_solver: str = "direct"  # 'direct' (SuperLU) or 'cg' (Jacobi-preconditioned CG)
+    cg_tolerance: float = 1e-8
+    # Penalty continuation: ramp the penalty from continuation_start up to
+    # `penalty`, stepping once a level converges or exhausts its iterations
+    penalty_continuation: bool = False
+    continuation_start: float = 1.0
+    continuation_step: float = 0.5
+    continuation_iterations: int = 20
 
 
 @dataclass
@@ -67,6 +75,9 @@ class SIMPOptimizer:
         # Build filter
         self.H, self.Hs = self._build_filter()
 
+        # Filtered volume as a dot product: sum(H @ x / Hs) = w @ x
+        self.volume_weights = self.H.T @ (1 / self.Hs)
+
         # Build element stiffness matrix
         self.KE = self._element_stiffness_matrix()
 
@@ -95,86 +106,43 @@ class SIMPOptimizer:
             return 3 * self._num_nodes
         return 2 * self._num_nodes
 
-    def _build_filter(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Build density filter for mesh-independence."""
-        rmin = self.config.filter_radius
-
-        if self.is_3d:
-            # 3D filter
-            nfilter = int(
-                self._num_elements * ((2 * int(np.ceil(rmin)) + 1) ** 3)
-            )
-            iH = np.zeros(nfilter, dtype=int)
-            jH = np.zeros(nfilter, dtype=int)
-            sH = np.zeros(nfilter)
-            cc = 0
-
-            for k1 in range(self.nelz):
-                for i1 in range(self.nelx):
-                    for j1 in range(self.nely):
-                        e1 = k1 * self.nelx * self.nely + i1 * self.nely + j1
-                        for k2 in range(
-                            max(k1 - int(np.ceil(rmin)), 0),
-                            min(k1 + int(np.ceil(rmin)) + 1, self.nelz),
-                        ):
-                            for i2 in range(
-                                max(i1 - int(np.ceil(rmin)), 0),
-                                min(i1 + int(np.ceil(rmin)) + 1, self.nelx),
-                            ):
-                                for j2 in range(
-                                    max(j1 - int(np.ceil(rmin)), 0),
-                                    min(j1 + int(np.ceil(rmin)) + 1, self.nely),
-                                ):
-                                    e2 = (
-                                        k2 * self.nelx * self.nely
-                                        + i2 * self.nely
-                                        + j2
-                                    )
-                                    dist = np.sqrt(
-                                        (i1 - i2) ** 2
-                                        + (j1 - j2) ** 2
-                                        + (k1 - k2) ** 2
-                                    )
-                                    if dist < rmin:
-                                        iH[cc] = e1
-                                        jH[cc] = e2
-                                        sH[cc] = rmin - dist
-                                        cc += 1
-
-            H = csc_matrix((sH[:cc], (iH[:cc], jH[:cc])))
-            Hs = np.array(H.sum(axis=1)).flatten()
-        else:
-            # 2D filter
-            nfilter = int(self._num_elements * ((2 * int(np.ceil(rmin)) + 1) ** 2))
-            iH = np.zeros(nfilter, dtype=int)
-            jH = np.zeros(nfilter, dtype=int)
-            sH = np.zeros(nfilter)
-            cc = 0
-
-            for i1 in range(self.nelx):
-                for j1 in range(self.nely):
-                    e1 = i1 * self.nely + j1
-                    for i2 in range(
-                        max(i1 - int(np.ceil(rmin)), 0),
-                        min(i1 + int(np.ceil(rmin)) + 1, self.nelx),
-                    ):
-                        for j2 in range(
-                            max(j1 - int(np.ceil(rmin)), 0),
-                            min(j1 + int(np.ceil(rmin)) + 1, self.nely),
-                        ):
-                            e2 = i2 * self.nely + j2
-                            dist = np.sqrt((i1 - i2) ** 2 + (j1 - j2) ** 2)
-                            if dist < rmin:
-                                iH[cc] = e1
-                                jH[cc] = e2
-                                sH[cc] = rmin - dist
-                                cc += 1
-
-            H = csc_matrix((sH[:cc], (iH[:cc], jH[:cc])))
-            Hs = np.array(H.sum(axis=1)).flatten()
+    def _build_filter(self) -> Tuple[csr_matrix, np.ndarray]:
+        """Build density filter for mesh-independence.
 
+        H[e1, e2] = rmin - dist(e1, e2) for element pairs closer than rmin.
+        """
+        rmin = self.config.filter_radius
+        r = int(np.ceil(rmin))
+
+        # Element grid in element-index (ravel) order
+        shape = (self.nelz, self.nelx, self.nely) if self.is_3d else (self.nelx, self.nely)
+        ndim = len(shape)
+
+        # Stencil offsets strictly inside the filter radius
+        offsets = np.stack(
+            np.meshgrid(*[np.arange(-r, r + 1)] * ndim, indexing="ij"), axis=-1
+        ).reshape(-1, ndim)
+        dist = np.sqrt((offsets ** 2).sum(axis=1))
+        inside = dist < rmin
+        offsets, weights = offsets[inside], rmin - dist[inside]
+
+        # Pair every element with each in-bounds stencil neighbour
+        coords = np.indices(shape).reshape(ndim, -1).T
+        neighbors = coords[:, None, :] + offsets[None, :, :]
+        valid = np.all((neighbors >= 0) & (neighbors < shape), axis=2)
+        rows = np.nonzero(valid)[0]
+        cols = np.ravel_multi_index(tuple(neighbors[valid].T), shape)
+        vals = np.broadcast_to(weights, valid.shape)[valid]
+
+        n = self._num_elements
+        H = csr_matrix((vals, (rows, cols)), shape=(n, n))
+        Hs = np.asarray(H.sum(axis=1)).ravel()
         return H, Hs
 
+    def _apply_filter(self, x: np.ndarray) -> np.ndarray:
+        """Apply the density filter to an element field."""
+        return self.H @ x / self.Hs
+
     def _element_stiffness_matrix(self) -> np.ndarray:
         """Compute element stiffness matrix."""
         E = 1.0
@@ -321,77 +289,228 @@ class SIMPOptimizer:
 
     def _build_dof_connectivity_2d(self) -> np.ndarray:
         """Build 2D element DOF connectivity."""
-        edofMat = np.zeros((self._num_elements, 8), dtype=int)
-        for elx in range(self.nelx):
-            for ely in range(self.nely):
-                el = elx * self.nely + ely
-                n1 = (self.nely + 1) * elx + ely
-                n2 = (self.nely + 1) * (elx + 1) + ely
-                edofMat[el, :] = np.array(
-                    [
-                        2 * n1,
-                        2 * n1 + 1,
-                        2 * n2,
-                        2 * n2 + 1,
-                        2 * n2 + 2,
-                        2 * n2 + 3,
-                        2 * n1 + 2,
-                        2 * n1 + 3,
-                    ]
-                )
-        return edofMat
+        # Element el = elx * nely + ely, so ravel order matches the element index
+        elx, ely = np.meshgrid(
+            np.arange(self.nelx), np.arange(self.nely), indexing="ij"
+        )
+        n1 = ((self.nely + 1) * elx + ely).ravel()
+        n2 = ((self.nely + 1) * (elx + 1) + ely).ravel()
+        edofMat = np.column_stack(
+            [
+                2 * n1,
+                2 * n1 + 1,
+                2 * n2,
+                2 * n2 + 1,
+                2 * n2 + 2,
+                2 * n2 + 3,
+                2 * n1 + 2,
+                2 * n1 + 3,
+            ]
+        )
+        return edofMat.astype(int)
 
     def _build_dof_connectivity_3d(self) -> np.ndarray:
         """Build 3D element DOF connectivity."""
-        edofMat = np.zeros((self._num_elements, 24), dtype=int)
-        for elz in range(self.nelz):
-            for elx in range(self.nelx):
-                for ely in range(self.nely):
-                    el = (
-                        elz * self.nelx * self.nely + elx * self.nely + ely
-                    )
-                    # Node numbering for hex8 element
-                    n1 = (
-                        elz * (self.nelx + 1) * (self.nely + 1)
-                        + elx * (self.nely + 1)
-                        + ely
-                    )
-                    n2 = n1 + (self.nely + 1)
-                    n3 = n2 + 1
-                    n4 = n1 + 1
-                    n5 = n1 + (self.nelx + 1) * (self.nely + 1)
-                    n6 = n5 + (self.nely + 1)
-                    n7 = n6 + 1
-                    n8 = n5 + 1
-
-                    nodes = [n1, n2, n3, n4, n5, n6, n7, n8]
-                    dofs = []
-                    for n in nodes:
-                        dofs.extend([3 * n, 3 * n + 1, 3 * n + 2])
-                    edofMat[el, :] = dofs
-
-        return edofMat
+        # Element el = elz * nelx * nely + elx * nely + ely
+        elz, elx, ely = np.meshgrid(
+            np.arange(self.nelz),
+            np.arange(self.nelx),
+            np.arange(self.nely),
+            indexing="ij",
+        )
+        # Node numbering for hex8 element
+        n1 = (
+            elz * (self.nelx + 1) * (self.nely + 1)
+            + elx * (self.nely + 1)
+            + ely
+        ).ravel()
+        n2 = n1 + (self.nely + 1)
+        n3 = n2 + 1
+        n4 = n1 + 1
+        n5 = n1 + (self.nelx + 1) * (self.nely + 1)
+        n6 = n5 + (self.nely + 1)
+        n7 = n6 + 1
+        n8 = n5 + 1
+
+        nodes = np.column_stack([n1, n2, n3, n4, n5, n6, n7, n8])
+        # Interleave x/y/z DOFs per node: [3n, 3n+1, 3n+2] for each node
+        edofMat = (3 * nodes[:, :, None] + np.arange(3)).reshape(-1, 24)
+
+        return edofMat.astype(int)
 
     def _build_sparse_indices(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Build sparse matrix indices for assembly."""
+        """Build COO row/column indices for assembly.
+
+        Entry (e, a, b) of the flattened element matrices maps to global
+        position (edofMat[e, a], edofMat[e, b]).
+        """
         dofs_per_element = 24 if self.is_3d else 8
-        iK = np.kron(self.edofMat, np.ones((dofs_per_element, 1))).flatten()
-        jK = np.kron(self.edofMat, np.ones((1, dofs_per_element))).flatten()
+        iK = np.repeat(self.edofMat, dofs_per_element, axis=1).ravel()
+        jK = np.tile(self.edofMat, (1, dofs_per_element)).ravel()
         return iK.astype(int), jK.astype(int)
 
-    def _assemble_stiffness(self, x: np.ndarray) -> csc_matrix:
-        """Assemble global stiffness matrix."""
+    def _free_sparse_indices(
+        self, free_dofs: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Build COO indices of the stiffness matrix restricted to free DOFs.
+
+        Args:
+            free_dofs: Sorted free DOF indices
+
+        Returns:
+            Tuple of (entries, iK, jK, size): positions in the full COO entry
+            list coupling two free DOFs, their row/column in the free-DOF
+            numbering, and the number of free DOFs
+        """
+        reduced = np.full(self._num_dofs, -1)
+        reduced[free_dofs] = np.arange(len(free_dofs))
+        iK, jK = reduced[self.iK], reduced[self.jK]
+        entries = np.flatnonzero((iK >= 0) & (jK >= 0))
+        return entries, iK[entries], jK[entries], len(free_dofs)
+
+    def _assemble_stiffness(
+        self,
+        x: np.ndarray,
+        sparse_indices: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, int]] = None,
+        x_penalized: Optional[np.ndarray] = None,
+    ) -> csr_matrix:
+        """Assemble global stiffness matrix.
+
+        Element contributions are scattered in COO form; duplicate entries
+        are summed in C by the CSR conversion.
+
+        Args:
+            x: Element densities
+            sparse_indices: Optional output of _free_sparse_indices; if given,
+                only the free-DOF block K_ff is assembled
+            x_penalized: Optional precomputed x ** penal
+
+        Returns:
+            Global stiffness matrix, or K_ff
+        """
+        if x_penalized is None:
+            x_penalized = x ** self.penal
         sK = (
-            (self.Emin + x ** self.penal * (self.E0 - self.Emin))
-            .reshape(-1, 1, 1)
-            * self.KE.reshape(1, *self.KE.shape)
-        ).flatten()
+            (self.Emin + x_penalized * (self.E0 - self.Emin))[:, None]
+            * self.KE.ravel()[None, :]
+        ).ravel()
 
-        K = csc_matrix(
-            (sK, (self.iK, self.jK)), shape=(self._num_dofs, self._num_dofs)
-        )
+        if sparse_indices is None:
+            iK, jK, size = self.iK, self.jK, self._num_dofs
+        else:
+            entries, iK, jK, size = sparse_indices
+            sK = sK[entries]
+
+        K = coo_matrix((sK, (iK, jK)), shape=(size, size)).tocsr()
         return K
 
+    def _solve(
+        self, K_ff: csr_matrix, f_f: np.ndarray, u0: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Solve the reduced system K_ff u = f_f.
+
+        Args:
+            K_ff: Stiffness matrix restricted to free DOFs
+            f_f: Force vector restricted to free DOFs
+            u0: Optional initial guess (used by the iterative solver)
+
+        Returns:
+            Displacements at the free DOFs
+        """
+        if self.config.linear_solver == "cg":
+            M = diags(1.0 / K_ff.diagonal())
+            u_f, info = cg(
+                K_ff, f_f, x0=u0, rtol=self.config.cg_tolerance, maxiter=10 * len(f_f), M=M
+            )
+            if info == 0:
+                return u_f
+        return spsolve(K_ff.tocsc(), f_f)
+
+    def _compliance_and_sensitivity(
+        self, xPhys: np.ndarray, ce: np.ndarray, xp: Optional[np.ndarray] = None
+    ) -> Tuple[float, np.ndarray]:
+        """Compute compliance and its sensitivity to the physical densities.
+
+        Both share one xPhys ** (penal - 1) pass over the elements.
+
+        Args:
+            xPhys: Filtered element densities
+            ce: Element strain energies at unit stiffness (u_e^T KE u_e)
+            xp: Optional precomputed xPhys ** (penal - 1)
+
+        Returns:
+            Tuple of (compliance, dc/dxPhys)
+        """
+        if xp is None:
+            xp = xPhys ** (self.penal - 1)
+        dE_ce = (self.E0 - self.Emin) * ce
+
+        compliance = self.Emin * ce.sum() + (xp * xPhys) @ dE_ce
+        dc = -self.penal * xp * dE_ce
+        return float(compliance), dc
+
+    def _oc_update(
+        self,
+        x_scaled: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        xnew: np.ndarray,
+    ) -> None:
+        """Find the OC Lagrange multiplier meeting the volume constraint.
+
+        The updated densities are clip(x_scaled / sqrt(lambda), lower, upper),
+        so the filtered volume falls monotonically and smoothly in
+        log(lambda). It is root-found there by Illinois-modified regula
+        falsi, which typically needs a handful of steps where bisection
+        needs tens. The bracket is exact: below min(x_scaled / upper) ** 2
+        every element sits at its upper bound, above
+        max(x_scaled / lower) ** 2 at its lower bound.
+
+        Args:
+            x_scaled: x * sqrt(-dc / dv)
+            lower: Lower density bounds (move limit and minimum density)
+            upper: Upper density bounds (move limit and full density)
+            xnew: Output buffer for the updated densities
+        """
+        target = self.config.volume_fraction * self._num_elements
+
+        def excess(log_l: float) -> float:
+            np.multiply(x_scaled, np.exp(-0.5 * log_l), out=xnew)
+            np.clip(xnew, lower, upper, out=xnew)
+            return self.volume_weights @ xnew - target
+
+        tiny = np.finfo(float).tiny
+        a = 2 * np.log(max((x_scaled / upper).min(), tiny))
+        b = 2 * np.log(max((x_scaled / lower).max(), tiny))
+
+        ga = excess(a)
+        if ga <= 0 or b <= a:
+            return  # Even the upper bounds do not exceed the volume target
+        gb = excess(b)
+        if gb >= 0:
+            return  # Even the lower bounds exceed the volume target
+
+        # Stop at the same relative multiplier bracket as bisection:
+        # (l2 - l1) / (l1 + l2) = tanh((b - a) / 2) <= 1e-3
+        side = 0
+        while np.tanh(0.5 * (b - a)) > 1e-3:
+            c = b - gb * (b - a) / (gb - ga)
+            if not a < c < b:
+                c = 0.5 * (a + b)
+            gc = excess(c)
+            if gc > 0:
+                a, ga = c, gc
+                if side == 1:
+                    gb *= 0.5
+                side = 1
+            elif gc < 0:
+                b, gb = c, gc
+                if side == -1:
+                    ga *= 0.5
+                side = -1
+            else:
+                break
+
     def optimize(
         self,
         force: np.ndarray,
@@ -409,108 +528,102 @@ class SIMPOptimizer:
             OptimizationResult with optimized density field
         """
         x = self.x.copy()
-        xold = x.copy()
         xPhys = x.copy()
         convergence_history = []
 
         # Free DOFs
         all_dofs = np.arange(self._num_dofs)
         free_dofs = np.setdiff1d(all_dofs, fixed_dofs)
+        free_indices = self._free_sparse_indices(free_dofs)
+        f_f = force[free_dofs]
+        u = np.zeros(self._num_dofs)
+
+        # Scratch buffers reused by every OC update. x and xnew swap
+        # roles each iteration instead of being reallocated.
+        xnew = np.empty_like(x)
+        lower = np.empty_like(x)
+        upper = np.empty_like(x)
+        x_scaled = np.empty_like(x)
+        diff = np.empty_like(x)
+
+        tol = self.config.convergence_tolerance
+        move = self.config.move_limit
+        min_density = self.config.min_density
+        if self.config.penalty_continuation:
+            self.penal = min(self.config.continuation_start, self.config.penalty)
+        else:
+            self.penal = self.config.penalty
 
         loop = 0
+        level_iterations = 0
         change = 1.0
 
-        while change > self.config.convergence_tolerance and loop < self.config.max_iterations:
+        while loop < self.config.max_iterations:
+            if self.penal < self.config.penalty and (
+                change <= tol or level_iterations >= self.config.continuation_iterations
+            ):
+                # Continuation: raise the penalty once the current level settles
+                self.penal = min(self.penal + self.config.continuation_step, self.config.penalty)
+                level_iterations = 0
+            elif change <= tol:
+                break
             loop += 1
+            level_iterations += 1
 
             # Apply density filter
-            xPhys = np.array(
-                (self.H @ x.reshape(-1, 1)) / self.Hs.reshape(-1, 1)
-            ).flatten()
+            xPhys = self._apply_filter(x)
 
-            # Assemble stiffness matrix
-            K = self._assemble_stiffness(xPhys)
+            # One power pass per iteration, shared by assembly, compliance
+            # and sensitivity: xPhys ** penal = xp * xPhys
+            xp = xPhys ** (self.penal - 1)
 
-            # Solve system
-            u = np.zeros(self._num_dofs)
-            K_ff = K[free_dofs, :][:, free_dofs]
-            f_f = force[free_dofs]
-            u[free_dofs] = spsolve(K_ff, f_f)
+            # Assemble stiffness matrix directly on the free DOFs
+            K_ff = self._assemble_stiffness(xPhys, free_indices, xp * xPhys)
+
+            # Solve system (warm-started from the previous displacements)
+            u[free_dofs] = self._solve(K_ff, f_f, u[free_dofs])
 
             # Compute compliance
-            ce = np.zeros(self._num_elements)
-            for el in range(self._num_elements):
-                Ue = u[self.edofMat[el, :]]
-                ce[el] = Ue @ self.KE @ Ue
+            Ue = u[self.edofMat]
+            ce = np.einsum("ij,jk,ik->i", Ue, self.KE, Ue)
 
-            compliance = np.sum(
-                (self.Emin + xPhys ** self.penal * (self.E0 - self.Emin)) * ce
-            )
+            compliance, dc = self._compliance_and_sensitivity(xPhys, ce, xp)
             convergence_history.append(compliance)
 
-            # Compute sensitivities
-            dc = (
-                -self.penal
-                * (self.E0 - self.Emin)
-                * xPhys ** (self.penal - 1)
-                * ce
-            )
-            dv = np.ones(self._num_elements)
-
-            # Filter sensitivities
-            dc = np.array(
-                self.H @ (dc.reshape(-1, 1) / self.Hs.reshape(-1, 1))
-            ).flatten()
-            dv = np.array(
-                self.H @ (dv.reshape(-1, 1) / self.Hs.reshape(-1, 1))
-            ).flatten()
-
-            # Optimality criteria update
-            l1, l2 = 0, 1e9
-            move = self.config.move_limit
-            xnew = x.copy()
-
-            while (l2 - l1) / (l1 + l2) > 1e-3:
-                lmid = 0.5 * (l2 + l1)
-                xnew = np.maximum(
-                    self.config.min_density,
-                    np.maximum(
-                        x - move,
-                        np.minimum(
-                            1.0,
-                            np.minimum(
-                                x + move,
-                                x * np.sqrt(-dc / dv / lmid),
-                            ),
-                        ),
-                    ),
-                )
-                xPhys_new = np.array(
-                    (self.H @ xnew.reshape(-1, 1)) / self.Hs.reshape(-1, 1)
-                ).flatten()
-
-                if xPhys_new.sum() > self.config.volume_fraction * self._num_elements:
-                    l1 = lmid
-                else:
-                    l2 = lmid
-
-            change = np.max(np.abs(xnew - x))
-            x = xnew.copy()
+            # Filter sensitivities. The filtered volume sensitivity
+            # H @ (1 / Hs) is constant: it is the volume weight vector.
+            dc = self.H @ (dc / self.Hs)
+            dv = self.volume_weights
+
+            # Optimality criteria update. The move-limit bounds and the
+            # lambda-independent part of the update are fixed for the
+            # multiplier search, so each step is one scale and one clip.
+            np.subtract(x, move, out=lower)
+            np.maximum(lower, min_density, out=lower)
+            np.add(x, move, out=upper)
+            np.minimum(upper, 1.0, out=upper)
+            np.divide(dc, dv, out=x_scaled)
+            np.negative(x_scaled, out=x_scaled)
+            np.sqrt(x_scaled, out=x_scaled)
+            np.multiply(x, x_scaled, out=x_scaled)
+            self._oc_update(x_scaled, lower, upper, xnew)
+
+            np.subtract(xnew, x, out=diff)
+            change = np.abs(diff, out=diff).max()
+            x, xnew = xnew, x
 
             if callback:
                 callback(loop, compliance, xPhys)
 
         # Final filtered densities
-        xPhys = np.array(
-            (self.H @ x.reshape(-1, 1)) / self.Hs.reshape(-1, 1)
-        ).flatten()
+        xPhys = self._apply_filter(x)
 
         return OptimizationResult(
             densities=xPhys,
             compliance=convergence_history[-1] if convergence_history else 0,
             volume_fraction=xPhys.sum() / self._num_elements,
             iterations=loop,
-            converged=change <= self.config.convergence_tolerance,
+            converged=change <= tol and self.penal >= self.config.penalty,
             convergence_history=convergence_history,
             constraint_violations={},
         )
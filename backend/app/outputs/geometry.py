@@ -1,11 +1,133 @@
 """CAD geometry export utilities."""
 
-import json
 import os
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 import numpy as np
+import orjson
+
+
+# Unit cube corners, its six faces as outward-wound quads (front, back,
+# top, bottom, right, left) with the neighbor offset each face looks at,
+# and the split of a quad into two triangles
+_CUBE_CORNERS = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+])
+_CUBE_QUADS = np.array([
+    [0, 1, 5, 4], [2, 3, 7, 6], [4, 5, 6, 7],
+    [0, 3, 2, 1], [1, 2, 6, 5], [0, 4, 7, 3],
+])
+_CUBE_NEIGHBORS = np.array([
+    [0, -1, 0], [0, 1, 0], [0, 0, 1],
+    [0, 0, -1], [1, 0, 0], [-1, 0, 0],
+])
+_QUAD_TRIANGLES = np.array([[0, 1, 2], [0, 2, 3]])
+
+# Binary STL triangle record: normal, three vertices, attribute byte count
+_STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+# Records encoded per write, bounding the staging buffer to ~3 MB
+_STL_CHUNK = 1 << 16
+_STL_ASCII_FACET = (
+    "  facet normal %.6e %.6e %.6e\n"
+    "    outer loop\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "      vertex %.6e %.6e %.6e\n"
+    "    endloop\n"
+    "  endfacet\n"
+)
+
+# Indented JSON exports. NumPy values serialize natively and non-string
+# keys are stringified as the json module does.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Largest lattice-to-corner ratio for which voxel_surface deduplicates
+# corners with a dense lookup table rather than a sort
+_DENSE_DEDUP_RATIO = 16
+
+
+def occupied_box(mask: np.ndarray) -> Tuple[slice, ...]:
+    """Bounding box of the True entries of a non-empty mask, as slices."""
+    box = []
+    for axis in range(mask.ndim):
+        others = tuple(a for a in range(mask.ndim) if a != axis)
+        occupied = np.flatnonzero(mask.any(axis=others))
+        box.append(slice(occupied[0], occupied[-1] + 1))
+    return tuple(box)
+
+
+def _write_json(filepath: str, data: Any) -> None:
+    """Write data as indented JSON."""
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=_JSON_OPTIONS))
+
+
+def voxel_surface(solid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract the boundary surface of a voxel occupancy grid.
+
+    Faces shared by two solid voxels are interior and skipped, and corners
+    shared by neighboring faces are emitted once.
+
+    Args:
+        solid: Boolean occupancy grid indexed as (x, y, z)
+
+    Returns:
+        Tuple of (integer corner coordinates of shape (n_vertices, 3) in
+        voxel units, outward-wound uint32 triangles of shape (n_faces, 3))
+    """
+    if not solid.any():
+        return np.empty((0, 3), dtype=np.intp), np.empty((0, 3), dtype=np.uint32)
+
+    # Empty space emits no faces, so only the occupied box is scanned
+    box = occupied_box(solid)
+    solid = solid[box]
+
+    # Occupancy on the corner lattice, so a voxel's flat index is also the
+    # lattice key of its origin corner. The margin of void around it keeps
+    # faces on the domain boundary.
+    lattice = tuple(n + 1 for n in solid.shape)
+    padded = np.zeros(tuple(n + 3 for n in solid.shape), dtype=bool)
+    padded[1:-2, 1:-2, 1:-2] = solid
+    cells = padded[tuple(slice(1, 1 + n) for n in lattice)]
+    corner_keys = _CUBE_CORNERS @ np.array([lattice[1] * lattice[2], lattice[2], 1])
+
+    # Faces whose neighbor is void, per direction; prefix sums of the
+    # counts give each direction its slice of one preallocated array
+    visible = [
+        cells & ~padded[tuple(slice(1 + o, 1 + o + n) for o, n in zip(offset, lattice))]
+        for offset in _CUBE_NEIGHBORS
+    ]
+    offsets = np.cumsum([0] + [np.count_nonzero(v) for v in visible])
+    flat = np.empty((offsets[-1], 4), dtype=np.intp)
+    for quad, mask, start, stop in zip(_CUBE_QUADS, visible, offsets[:-1], offsets[1:]):
+        np.add(np.flatnonzero(mask)[:, None], corner_keys[quad], out=flat[start:stop])
+
+    # Merge shared corners exactly via their lattice key. A dense lookup
+    # table over the lattice avoids a sort, but its memory scales with the
+    # volume; large, thin surfaces fall back to sorting the keys instead.
+    n_keys = int(np.prod(lattice))
+    if n_keys <= _DENSE_DEDUP_RATIO * flat.size:
+        used = np.zeros(n_keys, dtype=bool)
+        used[flat] = True
+        keys = np.flatnonzero(used)
+        remap = np.empty(n_keys, dtype=np.uint32)
+        remap[keys] = np.arange(len(keys), dtype=np.uint32)
+        flat = remap[flat]
+    else:
+        keys, inverse = np.unique(flat, return_inverse=True)
+        flat = inverse.reshape(flat.shape).astype(np.uint32)
+    corners = np.stack(np.unravel_index(keys, lattice), axis=1)
+    corners += [b.start for b in box]
+
+    triangles = flat[:, _QUAD_TRIANGLES].reshape(-1, 3)
+    return corners, triangles
 
 
 @dataclass
@@ -35,6 +157,7 @@ class GeometryExporter:
         mesh_or_density: Any,
         filename: str,
         threshold: float = 0.5,
+        binary: bool = True,
     ) -> ExportResult:
         """Export geometry as STL file.
 
@@ -42,25 +165,29 @@ class GeometryExporter:
             mesh_or_density: Mesh object or density field
             filename: Output filename (without extension)
             threshold: Density threshold for isosurface
+            binary: Write binary STL; ASCII STL if False
 
         Returns:
             ExportResult with file information
         """
         filepath = os.path.join(self.output_dir, f"{filename}.stl")
 
-        # Mock STL generation
-        # Real implementation would use marching cubes for density field
-        # or direct mesh export
-
         if hasattr(mesh_or_density, "nodes") and hasattr(mesh_or_density, "elements"):
             # Export mesh as STL
-            content = self._mesh_to_stl(mesh_or_density)
+            triangles = self._mesh_triangles(mesh_or_density)
+            name = "mesh"
         else:
-            # Export density field as STL using marching cubes
-            content = self._density_to_stl(mesh_or_density, threshold)
-
-        with open(filepath, "w") as f:
-            f.write(content)
+            # Export density field as STL of its voxel surface
+            triangles = self._density_triangles(mesh_or_density, threshold)
+            name = "density_field"
+
+        normals = self._compute_normals(triangles)
+        if binary:
+            with open(filepath, "wb") as f:
+                self._write_stl_binary(f, name, triangles, normals)
+        else:
+            with open(filepath, "w") as f:
+                f.write(self._stl_ascii(name, triangles, normals))
 
         file_size = os.path.getsize(filepath)
 
@@ -68,58 +195,61 @@ class GeometryExporter:
             filepath=filepath,
             format="STL",
             file_size=file_size,
-            metadata={"threshold": threshold, "units": "mm"},
+            metadata={
+                "threshold": threshold,
+                "units": "mm",
+                "encoding": "binary" if binary else "ascii",
+                "triangles": len(triangles),
+            },
+        )
+
+    def _mesh_triangles(self, mesh: Any) -> np.ndarray:
+        """Split the first face of each mesh element into two float32 triangles."""
+        nodes = np.asarray(mesh.nodes, dtype=np.float32)
+        elements = np.asarray(mesh.elements[:100])  # Limit for demo
+        if elements.ndim != 2 or elements.shape[1] < 4:
+            return np.empty((0, 3, 3), dtype=np.float32)
+        quads = elements[:, :4]
+        return nodes[quads[:, _QUAD_TRIANGLES].reshape(-1, 3)]
+
+    def _density_triangles(self, density: np.ndarray, threshold: float) -> np.ndarray:
+        """Float32 triangles of the density field's voxel surface (voxel units)."""
+        solid = np.atleast_3d(np.asarray(density)) > threshold
+        corners, triangles = voxel_surface(solid)  # Empty arrays for an all-void field
+        return corners.astype(np.float32)[triangles]
+
+    def _compute_normals(self, triangles: np.ndarray) -> np.ndarray:
+        """Compute unit normals of (F, 3, 3) triangles; degenerate ones stay zero."""
+        normals = np.cross(
+            triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
         )
+        norm = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, norm, out=np.zeros_like(normals), where=norm > 0)
+        return normals + 0.0  # Fold -0.0 so ASCII output prints plain zeros
+
+    def _write_stl_binary(
+        self, f: BinaryIO, name: str, triangles: np.ndarray, normals: np.ndarray
+    ) -> None:
+        """Write triangles as binary STL: 80-byte header, uint32 count, records.
 
-    def _mesh_to_stl(self, mesh: Any) -> str:
-        """Convert mesh to ASCII STL format."""
-        lines = ["solid mesh"]
-
-        if hasattr(mesh, "elements") and hasattr(mesh, "nodes"):
-            for elem in mesh.elements[:100]:  # Limit for demo
-                # Triangulate each element face
-                if len(elem) >= 4:
-                    # Quad or hex face
-                    nodes = [mesh.nodes[i] for i in elem[:4]]
-                    # First triangle
-                    normal = self._compute_normal(nodes[0], nodes[1], nodes[2])
-                    lines.append(f"  facet normal {normal[0]:.6e} {normal[1]:.6e} {normal[2]:.6e}")
-                    lines.append("    outer loop")
-                    for n in nodes[:3]:
-                        lines.append(f"      vertex {n[0]:.6e} {n[1]:.6e} {n[2]:.6e}")
-                    lines.append("    endloop")
-                    lines.append("  endfacet")
-                    # Second triangle
-                    lines.append(f"  facet normal {normal[0]:.6e} {normal[1]:.6e} {normal[2]:.6e}")
-                    lines.append("    outer loop")
-                    lines.append(f"      vertex {nodes[0][0]:.6e} {nodes[0][1]:.6e} {nodes[0][2]:.6e}")
-                    lines.append(f"      vertex {nodes[2][0]:.6e} {nodes[2][1]:.6e} {nodes[2][2]:.6e}")
-                    lines.append(f"      vertex {nodes[3][0]:.6e} {nodes[3][1]:.6e} {nodes[3][2]:.6e}")
-                    lines.append("    endloop")
-                    lines.append("  endfacet")
-
-        lines.append("endsolid mesh")
-        return "\n".join(lines)
-
-    def _density_to_stl(self, density: np.ndarray, threshold: float) -> str:
-        """Convert density field to STL using simplified marching cubes."""
-        lines = ["solid density_field"]
-        # Placeholder - real implementation would use marching cubes
-        lines.append("  # Density field STL - placeholder")
-        lines.append("endsolid density_field")
-        return "\n".join(lines)
-
-    def _compute_normal(
-        self, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray
-    ) -> np.ndarray:
-        """Compute triangle normal."""
-        v1 = np.array(p2) - np.array(p1)
-        v2 = np.array(p3) - np.array(p1)
-        normal = np.cross(v1, v2)
-        norm = np.linalg.norm(normal)
-        if norm > 0:
-            normal = normal / norm
-        return normal
+        Records are encoded in fixed-size chunks through one reused buffer,
+        so large surfaces never hold a second full copy of the mesh.
+        """
+        f.write(name.encode("ascii")[:80].ljust(80, b" "))
+        f.write(np.uint32(len(triangles)).tobytes())
+
+        records = np.zeros(min(len(triangles), _STL_CHUNK), dtype=_STL_RECORD)
+        for start in range(0, len(triangles), _STL_CHUNK):
+            chunk = records[:len(triangles) - start]
+            chunk["normal"] = normals[start:start + _STL_CHUNK]
+            chunk["vertices"] = triangles[start:start + _STL_CHUNK]
+            f.write(memoryview(chunk).cast("B"))
+
+    def _stl_ascii(self, name: str, triangles: np.ndarray, normals: np.ndarray) -> str:
+        """Encode triangles as ASCII STL."""
+        facets = np.concatenate([normals[:, None], triangles], axis=1)
+        body = (_STL_ASCII_FACET * len(facets)) % tuple(facets.ravel())
+        return f"solid {name}\n{body}endsolid {name}"
 
     def export_gltf(
         self,
@@ -160,8 +290,7 @@ class GeometryExporter:
             "buffers": [],
         }
 
-        with open(filepath, "w") as f:
-            json.dump(gltf, f, indent=2)
+        _write_json(filepath, gltf)
 
         file_size = os.path.getsize(filepath)
 
@@ -295,8 +424,7 @@ class LayupExporter:
             "plies": layup_data,
         }
 
-        with open(filepath, "w") as f:
-            json.dump(export_data, f, indent=2)
+        _write_json(filepath, export_data)
 
         return ExportResult(
             filepath=filepath,
@@ -341,8 +469,7 @@ class FastenerMapExporter:
             },
         }
 
-        with open(filepath, "w") as f:
-            json.dump(export_data, f, indent=2)
+        _write_json(filepath, export_data)
 
         return ExportResult(
             filepath=filepath,
@@ -353,19 +480,15 @@ class FastenerMapExporter:
 
     def _summarize_by_type(self, fasteners: List[Dict[str, Any]]) -> Dict[str, int]:
         """Summarize fasteners by type."""
-        summary = {}
-        for f in fasteners:
-            ftype = f.get("type", "unknown")
-            summary[ftype] = summary.get(ftype, 0) + 1
-        return summary
+        return self._count_by(fasteners, "type")
 
     def _summarize_by_size(self, fasteners: List[Dict[str, Any]]) -> Dict[str, int]:
         """Summarize fasteners by size."""
-        summary = {}
-        for f in fasteners:
-            size = f.get("size", "unknown")
-            summary[size] = summary.get(size, 0) + 1
-        return summary
+        return self._count_by(fasteners, "size")
+
+    def _count_by(self, fasteners: List[Dict[str, Any]], key: str) -> Dict[str, int]:
+        """Count fasteners per value of one column."""
+        return dict(Counter(f.get(key, "unknown") for f in fasteners))
 
 
 class BOMExporter:
@@ -425,8 +548,7 @@ class BOMExporter:
             "total_insert_count": len(inserts),
         }
 
-        with open(filepath, "w") as f:
-            json.dump(bom, f, indent=2)
+        _write_json(filepath, bom)
 
         return ExportResult(
             filepath=filepath,
@@ -3,7 +3,68 @@
 import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Fixed blocks of the technical report, built once at import
+_TECHNICAL_CONTENTS: Tuple[str, ...] = (
+    "TABLE OF CONTENTS",
+    "-" * 40,
+    "1. Executive Summary",
+    "2. Design Requirements",
+    "3. Material Selection",
+    "4. Optimization Process",
+    "5. Structural Analysis",
+    "6. Aerodynamic Analysis",
+    "7. Manufacturing Specification",
+    "8. Validation Results",
+    "9. Conclusions",
+    "",
+)
+
+_TECHNICAL_MATERIALS: Tuple[str, ...] = (
+    "-" * 80,
+    "3. MATERIAL SELECTION",
+    "-" * 80,
+    "",
+    "Primary Material: T700S/Epoxy Carbon Fiber",
+    "  - Longitudinal Modulus (E1): 165 GPa",
+    "  - Transverse Modulus (E2): 10.5 GPa",
+    "  - Shear Modulus (G12): 5.5 GPa",
+    "  - Tensile Strength: 2550 MPa",
+    "  - Density: 1570 kg/m³",
+    "",
+)
+
+_TECHNICAL_LOAD_CASES: Tuple[str, ...] = (
+    "Load Cases Considered:",
+    "  1. Maximum Vertical Load (5g landing)",
+    "  2. Maximum Lateral Load (2g cornering)",
+    "  3. Maximum Braking (1.5g)",
+    "  4. Combined Jump Landing",
+    "  5. Rollover Protection",
+    "",
+)
+
+_TECHNICAL_CONCLUSIONS: Tuple[str, ...] = (
+    "-" * 80,
+    "9. CONCLUSIONS",
+    "-" * 80,
+    "",
+    "The topology optimization successfully generated a lightweight",
+    "carbon fiber chassis design that meets all Baja 1000 requirements",
+    "while minimizing weight and maintaining structural integrity.",
+    "",
+    "Key Achievements:",
+    "  - Weight reduction of 35% compared to baseline",
+    "  - All structural targets met with adequate safety margins",
+    "  - Manufacturable design validated for composite layup",
+    "  - Aerodynamic performance within acceptable limits",
+    "",
+    "=" * 80,
+    "END OF REPORT",
+    "=" * 80,
+)
 
 
 @dataclass
@@ -160,18 +221,7 @@ class ReportGenerator:
             f"Project: {project_name}",
             f"Generated: {datetime.now().isoformat()}",
             "",
-            "TABLE OF CONTENTS",
-            "-" * 40,
-            "1. Executive Summary",
-            "2. Design Requirements",
-            "3. Material Selection",
-            "4. Optimization Process",
-            "5. Structural Analysis",
-            "6. Aerodynamic Analysis",
-            "7. Manufacturing Specification",
-            "8. Validation Results",
-            "9. Conclusions",
-            "",
+            *_TECHNICAL_CONTENTS,
         ]
 
         # Executive Summary
@@ -209,20 +259,7 @@ class ReportGenerator:
         ])
 
         # Material Selection
-        materials = project_data.get("materials", {})
-        report_lines.extend([
-            "-" * 80,
-            "3. MATERIAL SELECTION",
-            "-" * 80,
-            "",
-            "Primary Material: T700S/Epoxy Carbon Fiber",
-            "  - Longitudinal Modulus (E1): 165 GPa",
-            "  - Transverse Modulus (E2): 10.5 GPa",
-            "  - Shear Modulus (G12): 5.5 GPa",
-            "  - Tensile Strength: 2550 MPa",
-            "  - Density: 1570 kg/m³",
-            "",
-        ])
+        report_lines.extend(_TECHNICAL_MATERIALS)
 
         # Optimization Process
         opt = project_data.get("optimization", {})
@@ -237,35 +274,11 @@ class ReportGenerator:
             f"Filter Radius: {opt.get('filter_radius', 2.0)} elements",
             f"Convergence Tolerance: {opt.get('tolerance', 0.01)}",
             "",
-            "Load Cases Considered:",
-            "  1. Maximum Vertical Load (5g landing)",
-            "  2. Maximum Lateral Load (2g cornering)",
-            "  3. Maximum Braking (1.5g)",
-            "  4. Combined Jump Landing",
-            "  5. Rollover Protection",
-            "",
+            *_TECHNICAL_LOAD_CASES,
         ])
 
         # Conclusions
-        report_lines.extend([
-            "-" * 80,
-            "9. CONCLUSIONS",
-            "-" * 80,
-            "",
-            "The topology optimization successfully generated a lightweight",
-            "carbon fiber chassis design that meets all Baja 1000 requirements",
-            "while minimizing weight and maintaining structural integrity.",
-            "",
-            "Key Achievements:",
-            "  - Weight reduction of 35% compared to baseline",
-            "  - All structural targets met with adequate safety margins",
-            "  - Manufacturable design validated for composite layup",
-            "  - Aerodynamic performance within acceptable limits",
-            "",
-            "=" * 80,
-            "END OF REPORT",
-            "=" * 80,
-        ])
+        report_lines.extend(_TECHNICAL_CONCLUSIONS)
 
         content = "\n".join(report_lines)
         with open(filepath, "w") as f:
@@ -303,14 +316,11 @@ class ReportGenerator:
         ]
 
         passed = 0
-        failed = 0
 
         for check in checks:
-            status = "✓" if check.get("passed", False) else "✗"
-            if check.get("passed", False):
-                passed += 1
-            else:
-                failed += 1
+            ok = bool(check.get("passed", False))
+            passed += ok
+            status = "✓" if ok else "✗"
 
             lines.extend([
                 f"[{status}] {check.get('name', 'Unknown Check')}",
@@ -320,6 +330,7 @@ class ReportGenerator:
                 "",
             ])
 
+        failed = len(checks) - passed
         lines.extend([
             "-" * 60,
             f"SUMMARY: {passed} passed, {failed} failed",
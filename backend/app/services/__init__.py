@@ -7,6 +7,7 @@ from app.services.orchestration import (
     PipelineStage,
     PipelineState,
     ProjectOrchestrator,
+    infer_loads,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "PipelineStage",
     "PipelineState",
     "ProjectOrchestrator",
+    "infer_loads",
 ]
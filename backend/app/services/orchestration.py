@@ -1,13 +1,21 @@
 """Project orchestration service for the optimization pipeline."""
 
 import asyncio
+import json
+import multiprocessing
+import os
+import struct
+import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional, Callable, Tuple, TypedDict
 
 import numpy as np
+import orjson
 
 from app.optimization.simp import SIMPConfig, SIMPOptimizer
 from app.optimization.level_set import LevelSetConfig, LevelSetOptimizer
@@ -15,6 +23,14 @@ from app.fe_solver.mesh import MeshGenerator, MeshConfig
 from app.fe_solver.solver import FESolver, LoadCase, MaterialProperties, Constraint
 from app.cfd.solver import CFDSolver, CFDConfig
 from app.manufacturing.validator import ManufacturingValidator
+from app.outputs.geometry import occupied_box, voxel_surface
+
+
+@lru_cache(maxsize=32)
+def _ensure_dir(path: str) -> str:
+    """Create a directory once per process and return its path."""
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
 class PipelineStage(str, Enum):
@@ -33,7 +49,14 @@ class PipelineStage(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+class PipelineArtifacts(TypedDict, total=False):
+    """Artifacts produced by the pipeline (paths and URLs)."""
+    
+    gltf_model: str
+    viewer_model_url: str
+
+
+@dataclass(slots=True)
 class PipelineState:
     """Current state of the optimization pipeline."""
     
@@ -42,247 +65,189 @@ class PipelineState:
     current_iteration: int
     total_iterations: int
     message: str
-    artifacts: Dict[str, str]  # artifact_type -> URL/path
+    artifacts: PipelineArtifacts
     metrics: Dict[str, float]
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
 
 
-class LoadInferenceService:
-    """Service to auto-generate load cases from mission profile."""
-    
-    MISSION_PROFILES = {
-        "baja_1000": {
-            "name": "Baja 1000 Off-Road Race",
-            "max_vertical_g": 5.0,
-            "max_lateral_g": 2.0,
-            "max_braking_g": 1.5,
-            "impact_velocity_mps": 15.0,
-            "roll_over": True,
-            "terrain": "desert",
-            "duration_hours": 24,
-        },
-        "desert_rally": {
-            "name": "Desert Rally",
-            "max_vertical_g": 4.0,
-            "max_lateral_g": 1.8,
-            "max_braking_g": 1.2,
-            "impact_velocity_mps": 12.0,
-            "roll_over": True,
-            "terrain": "desert",
-            "duration_hours": 8,
-        },
-        "rock_crawling": {
-            "name": "Rock Crawling",
-            "max_vertical_g": 3.0,
-            "max_lateral_g": 1.5,
-            "max_braking_g": 0.8,
-            "impact_velocity_mps": 5.0,
-            "roll_over": True,
-            "terrain": "rocky",
-            "duration_hours": 4,
-        }
+# Auto-generated load cases: (name, type, description, safety factor).
+# Descriptions are formatted with the mission profile.
+_LOAD_CASE_LABELS = (
+    ("Maximum Vertical (Jump Landing)", "static", "{max_vertical_g}g vertical landing from jump", 1.5),
+    ("Maximum Lateral (Cornering)", "static", "{max_lateral_g}g lateral cornering", 1.5),
+    ("Maximum Braking", "static", "{max_braking_g}g braking deceleration", 1.5),
+    ("Asymmetric Jump Landing", "static", "Landing with one wheel first", 1.5),
+    ("Rollover Protection", "static", "Rollover load on roll cage", 2.0),
+    ("Torsion (Wheel in Hole)", "static", "Torsional load from wheel drop", 1.5),
+    ("Front Impact", "impact", "Front impact at {impact_velocity_mps} m/s", 1.25),
+)
+_ROLLOVER_CASE = 4
+
+# One row per applied force: load case index, direction (x, y, z),
+# application point (x, y, z) in mm
+_LOAD_CASE_FORCES = np.array([
+    [0, 0, 0, -1, 1500, 0, 500],
+    [1, 0, 1, 0, 1500, 0, 500],
+    [2, -1, 0, 0, 1500, 0, 500],
+    [3, 0, 0, -1, 2800, 800, 0],
+    [4, 0, 0, -1, 1500, 0, 1400],
+    [5, 0, 0, -1, 2800, -800, 0],
+    [5, 0, 0, -1, 200, 800, 0],
+    [6, -1, 0, 0, 3000, 0, 400],
+], dtype=np.int32)
+_LOAD_CASE_FORCE_LABELS = (
+    ("Vertical Load", "cg"),
+    ("Lateral Load", "cg"),
+    ("Braking Force", "cg"),
+    ("Front Right Impact", "front_right_wheel"),
+    ("Cage Crush Load", "roll_cage_top"),
+    ("Front Left Down", "front_left_wheel"),
+    ("Rear Right Down", "rear_right_wheel"),
+    ("Impact Force", "front_bumper"),
+)
+
+
+MISSION_PROFILES: Final[Dict[str, Dict[str, Any]]] = {
+    "baja_1000": {
+        "name": "Baja 1000 Off-Road Race",
+        "max_vertical_g": 5.0,
+        "max_lateral_g": 2.0,
+        "max_braking_g": 1.5,
+        "impact_velocity_mps": 15.0,
+        "roll_over": True,
+        "terrain": "desert",
+        "duration_hours": 24,
+    },
+    "desert_rally": {
+        "name": "Desert Rally",
+        "max_vertical_g": 4.0,
+        "max_lateral_g": 1.8,
+        "max_braking_g": 1.2,
+        "impact_velocity_mps": 12.0,
+        "roll_over": True,
+        "terrain": "desert",
+        "duration_hours": 8,
+    },
+    "rock_crawling": {
+        "name": "Rock Crawling",
+        "max_vertical_g": 3.0,
+        "max_lateral_g": 1.5,
+        "max_braking_g": 0.8,
+        "impact_velocity_mps": 5.0,
+        "roll_over": True,
+        "terrain": "rocky",
+        "duration_hours": 4,
     }
-    
-    @classmethod
-    def infer_loads(
-        cls,
-        mission_profile: str = "baja_1000",
-        rules_config: Optional[Dict[str, Any]] = None,
-        vehicle_mass_kg: float = 2500.0,
-    ) -> Dict[str, Any]:
-        """Infer load cases from mission profile and rules.
-        
-        Args:
-            mission_profile: Name of mission profile
-            rules_config: Optional rules configuration
-            vehicle_mass_kg: Total vehicle mass in kg
-            
-        Returns:
-            Load cases configuration with auto-generated cases
-        """
-        profile = cls.MISSION_PROFILES.get(mission_profile, cls.MISSION_PROFILES["baja_1000"])
-        g = 9.81
-        
-        load_cases = []
-        
-        # Maximum vertical load (landing from jump)
-        vertical_g = profile["max_vertical_g"]
-        vertical_force = vehicle_mass_kg * g * vertical_g
-        load_cases.append({
-            "name": "Maximum Vertical (Jump Landing)",
-            "type": "static",
-            "description": f"{vertical_g}g vertical landing from jump",
-            "forces": [
-                {
-                    "name": "Vertical Load",
-                    "location": "cg",
-                    "magnitude": vertical_force,
-                    "direction": [0, 0, -1],
-                    "x": 1500, "y": 0, "z": 500
-                }
-            ],
-            "accelerations": [0, 0, -vertical_g * g],
-            "safety_factor": 1.5,
-            "load_factor": 1.0
-        })
-        
-        # Maximum lateral load (cornering)
-        lateral_g = profile["max_lateral_g"]
-        lateral_force = vehicle_mass_kg * g * lateral_g
-        load_cases.append({
-            "name": "Maximum Lateral (Cornering)",
-            "type": "static",
-            "description": f"{lateral_g}g lateral cornering",
-            "forces": [
-                {
-                    "name": "Lateral Load",
-                    "location": "cg",
-                    "magnitude": lateral_force,
-                    "direction": [0, 1, 0],
-                    "x": 1500, "y": 0, "z": 500
-                }
-            ],
-            "accelerations": [0, lateral_g * g, -g],
-            "safety_factor": 1.5,
-            "load_factor": 1.0
-        })
-        
-        # Maximum braking
-        braking_g = profile["max_braking_g"]
-        braking_force = vehicle_mass_kg * g * braking_g
-        load_cases.append({
-            "name": "Maximum Braking",
-            "type": "static",
-            "description": f"{braking_g}g braking deceleration",
-            "forces": [
-                {
-                    "name": "Braking Force",
-                    "location": "cg",
-                    "magnitude": braking_force,
-                    "direction": [-1, 0, 0],
-                    "x": 1500, "y": 0, "z": 500
-                }
-            ],
-            "accelerations": [-braking_g * g, 0, -g],
-            "safety_factor": 1.5,
-            "load_factor": 1.0
-        })
-        
-        # Combined jump landing (asymmetric)
-        load_cases.append({
-            "name": "Asymmetric Jump Landing",
-            "type": "static",
-            "description": "Landing with one wheel first",
-            "forces": [
-                {
-                    "name": "Front Right Impact",
-                    "location": "front_right_wheel",
-                    "magnitude": vertical_force * 0.7,
-                    "direction": [0, 0, -1],
-                    "x": 2800, "y": 800, "z": 0
-                }
-            ],
-            "accelerations": [0, 0.5 * g, -3 * g],
-            "safety_factor": 1.5,
-            "load_factor": 1.0
-        })
-        
-        # Rollover protection
-        if profile["roll_over"]:
-            rollover_force = vehicle_mass_kg * g * 2.5  # 2.5x vehicle weight on cage
-            load_cases.append({
-                "name": "Rollover Protection",
-                "type": "static",
-                "description": "Rollover load on roll cage",
-                "forces": [
-                    {
-                        "name": "Cage Crush Load",
-                        "location": "roll_cage_top",
-                        "magnitude": rollover_force,
-                        "direction": [0, 0, -1],
-                        "x": 1500, "y": 0, "z": 1400
-                    }
-                ],
-                "accelerations": [0, 0, -g],
-                "safety_factor": 2.0,
-                "load_factor": 1.0
-            })
-        
-        # Torsion (one wheel in hole)
-        torsion_force = vehicle_mass_kg * g * 2.0
-        load_cases.append({
-            "name": "Torsion (Wheel in Hole)",
-            "type": "static",
-            "description": "Torsional load from wheel drop",
-            "forces": [
-                {
-                    "name": "Front Left Down",
-                    "location": "front_left_wheel",
-                    "magnitude": torsion_force,
-                    "direction": [0, 0, -1],
-                    "x": 2800, "y": -800, "z": 0
-                },
-                {
-                    "name": "Rear Right Down",
-                    "location": "rear_right_wheel",
-                    "magnitude": torsion_force * 0.5,
-                    "direction": [0, 0, -1],
-                    "x": 200, "y": 800, "z": 0
-                }
-            ],
-            "accelerations": [0, 0, -g],
-            "safety_factor": 1.5,
-            "load_factor": 1.0
-        })
-        
-        # Front impact
-        impact_velocity = profile["impact_velocity_mps"]
-        # Rough estimate: F = m * v / dt, assume dt = 0.1s
-        impact_force = vehicle_mass_kg * impact_velocity / 0.1
-        load_cases.append({
-            "name": "Front Impact",
-            "type": "impact",
-            "description": f"Front impact at {impact_velocity} m/s",
+}
+
+
+def infer_loads(
+    mission_profile: str = "baja_1000",
+    rules_config: Optional[Dict[str, Any]] = None,
+    vehicle_mass_kg: float = 2500.0,
+) -> Dict[str, Any]:
+    """Infer load cases from mission profile and rules.
+
+    Args:
+        mission_profile: Name of mission profile
+        rules_config: Optional rules configuration
+        vehicle_mass_kg: Total vehicle mass in kg
+
+    Returns:
+        Load cases configuration with auto-generated cases
+    """
+    profile = MISSION_PROFILES.get(mission_profile, MISSION_PROFILES["baja_1000"])
+    g = 9.81
+    vertical_g = profile["max_vertical_g"]
+    lateral_g = profile["max_lateral_g"]
+    braking_g = profile["max_braking_g"]
+
+    # Acceleration driving each force row of _LOAD_CASE_FORCES (F = m * a)
+    force_accels = g * np.array([
+        vertical_g,        # Jump landing
+        lateral_g,         # Cornering
+        braking_g,         # Braking
+        0.7 * vertical_g,  # One wheel takes 70% of the landing
+        2.5,               # 2.5x vehicle weight on cage
+        2.0,               # Torsion, front wheel
+        1.0,               # Torsion, rear wheel (half the front load)
+        0.0,
+    ])
+    # Front impact: rough estimate F = m * v / dt, assume dt = 0.1s
+    force_accels[-1] = profile["impact_velocity_mps"] / 0.1
+    magnitudes = vehicle_mass_kg * force_accels
+
+    # Inertial accelerations per load case, in g
+    case_accels = g * np.array([
+        [0, 0, -vertical_g],
+        [0, lateral_g, -1],
+        [-braking_g, 0, -1],
+        [0, 0.5, -3],
+        [0, 0, -1],
+        [0, 0, -1],
+        [0, 0, -1],
+    ])
+
+    load_cases = [
+        {
+            "name": name,
+            "type": case_type,
+            "description": description.format(**profile),
             "forces": [
                 {
-                    "name": "Impact Force",
-                    "location": "front_bumper",
-                    "magnitude": impact_force,
-                    "direction": [-1, 0, 0],
-                    "x": 3000, "y": 0, "z": 400
+                    "name": _LOAD_CASE_FORCE_LABELS[row][0],
+                    "location": _LOAD_CASE_FORCE_LABELS[row][1],
+                    "magnitude": float(magnitudes[row]),
+                    "direction": _LOAD_CASE_FORCES[row, 1:4].tolist(),
+                    "x": int(_LOAD_CASE_FORCES[row, 4]),
+                    "y": int(_LOAD_CASE_FORCES[row, 5]),
+                    "z": int(_LOAD_CASE_FORCES[row, 6]),
                 }
+                for row in np.flatnonzero(_LOAD_CASE_FORCES[:, 0] == case)
             ],
-            "accelerations": [0, 0, -g],
-            "safety_factor": 1.25,
-            "load_factor": 1.0
-        })
-        
-        return {
-            "mission_profile": mission_profile,
-            "load_cases": load_cases,
-            "max_vertical_g": profile["max_vertical_g"],
-            "max_lateral_g": profile["max_lateral_g"],
-            "max_braking_g": profile["max_braking_g"],
-            "impact_velocity": profile["impact_velocity_mps"],
-            "roll_over_scenario": profile["roll_over"],
-            "vehicle_mass_kg": vehicle_mass_kg,
-            "auto_generated": True
+            "accelerations": case_accels[case].tolist(),
+            "safety_factor": safety_factor,
+            "load_factor": 1.0,
         }
+        for case, (name, case_type, description, safety_factor) in enumerate(_LOAD_CASE_LABELS)
+        if case != _ROLLOVER_CASE or profile["roll_over"]
+    ]
+
+    return {
+        "mission_profile": mission_profile,
+        "load_cases": load_cases,
+        "max_vertical_g": profile["max_vertical_g"],
+        "max_lateral_g": profile["max_lateral_g"],
+        "max_braking_g": profile["max_braking_g"],
+        "impact_velocity": profile["impact_velocity_mps"],
+        "roll_over_scenario": profile["roll_over"],
+        "vehicle_mass_kg": vehicle_mass_kg,
+        "auto_generated": True
+    }
+
+
+class LoadInferenceService:
+    """Service to auto-generate load cases from mission profile."""
+    
+    MISSION_PROFILES = MISSION_PROFILES
+    infer_loads = staticmethod(infer_loads)
 
 
 class DesignSpaceBuilder:
     """Service to build design space from rules and components."""
     
-    @classmethod
+    @staticmethod
     def build_from_rules(
-        cls,
         rules_config: Dict[str, Any],
         components_config: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Build design space from rules configuration.
         
+        Results are memoized on the canonical JSON form of the inputs;
+        each call returns a fresh copy the caller may mutate.
+        
         Args:
             rules_config: Parsed rules configuration
             components_config: Component placement configuration
@@ -290,6 +255,26 @@ class DesignSpaceBuilder:
         Returns:
             Design space configuration
         """
+        return json.loads(DesignSpaceBuilder._build_cached(
+            json.dumps(rules_config, sort_keys=True),
+            json.dumps(components_config, sort_keys=True),
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_cached(rules_json: str, components_json: str) -> str:
+        """Build the design space from frozen (JSON) inputs."""
+        return json.dumps(DesignSpaceBuilder._build(
+            json.loads(rules_json),
+            json.loads(components_json),
+        ))
+    
+    @staticmethod
+    def _build(
+        rules_config: Dict[str, Any],
+        components_config: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Construct the design space configuration (uncached)."""
         # Extract dimensional constraints
         max_width = rules_config.get("max_width", 2438)  # mm
         max_length = rules_config.get("max_length", 5486)  # mm
@@ -424,9 +409,7 @@ class OptimizationRunner:
         Args:
             output_dir: Directory for output files
         """
-        self.output_dir = output_dir
-        import os
-        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = _ensure_dir(output_dir)
     
     def run_simp(
         self,
@@ -436,6 +419,7 @@ class OptimizationRunner:
         optimization_params: Dict[str, Any],
         manufacturing_config: Optional[Dict[str, Any]] = None,
         progress_callback: Optional[Callable[[int, float, Dict], None]] = None,
+        full: bool = True,
     ) -> Dict[str, Any]:
         """Run SIMP topology optimization.
         
@@ -446,6 +430,8 @@ class OptimizationRunner:
             optimization_params: Optimization parameters
             manufacturing_config: Manufacturing constraints
             progress_callback: Optional progress callback
+            full: Include the density field; when False only the
+                convergence metrics are returned
             
         Returns:
             Optimization results with density field and metrics
@@ -455,6 +441,7 @@ class OptimizationRunner:
         penalty = optimization_params.get("penalty_factor", 3.0)
         max_iterations = optimization_params.get("max_iterations", 200)
         filter_radius = optimization_params.get("filter_radius", 2.0)
+        penalty_continuation = optimization_params.get("penalty_continuation", False)
         
         # Mesh size (simplified for demo)
         design_vol = design_space.get("design_volume", {})
@@ -468,11 +455,16 @@ class OptimizationRunner:
         nely = max(5, int(width / elem_size))
         nelz = max(5, int(height / elem_size))
         
-        # Limit mesh size for performance
-        max_elements = 30
-        nelx = min(nelx, max_elements)
-        nely = min(nely, max_elements // 2)
-        nelz = min(nelz, max_elements // 3)
+        # Coarsen uniformly (preserving aspect ratio) to stay within the
+        # element budget. Assembly is vectorized COO and the solve is
+        # iterative, so per-iteration cost grows roughly linearly with it.
+        max_elements = optimization_params.get("max_elements", 15000)
+        requested_elements = nelx * nely * nelz
+        if requested_elements > max_elements:
+            shrink = (max_elements / requested_elements) ** (1 / 3)
+            nelx = max(10, int(nelx * shrink))
+            nely = max(5, int(nely * shrink))
+            nelz = max(5, int(nelz * shrink))
         
         # Create SIMP configuration
         config = SIMPConfig(
@@ -481,9 +473,11 @@ class OptimizationRunner:
             nelz=nelz,
             volume_fraction=volume_fraction,
             penalty=penalty,
+            penalty_continuation=penalty_continuation,
             filter_radius=filter_radius,
-            max_iterations=min(max_iterations, 100),  # Limit for demo
+            max_iterations=max_iterations,
             convergence_tolerance=0.01,
+            linear_solver="cg",
         )
         
         # Initialize optimizer
@@ -491,19 +485,24 @@ class OptimizationRunner:
         
         # Set up loads (simplified)
         n_dofs = optimizer._num_dofs
-        force = np.zeros(n_dofs)
+        force = np.zeros(n_dofs, dtype=np.float32)
         
         # Apply forces from load cases
-        total_force = 0
-        for lc in load_cases.get("load_cases", []):
-            for f in lc.get("forces", []):
-                total_force += f.get("magnitude", 1000)
+        total_force = sum(
+            f.get("magnitude", 1000)
+            for lc in load_cases.get("load_cases", ())
+            for f in lc.get("forces", ())
+        )
         
         # Apply force at a point (simplified)
         if n_dofs > 0:
             force_idx = n_dofs // 2
             force[force_idx] = -total_force / 10000  # Scale for solver
         
+        # Element counts as seen by the solver (2D problems have a single layer)
+        mesh_nelz = nelz if optimizer.is_3d else 1
+        n_elements = nelx * nely * mesh_nelz
+        
         # Fixed DOFs (left face)
         if optimizer.is_3d:
             fixed_dofs = np.arange(0, 3 * (nely + 1) * (nelz + 1))
@@ -524,19 +523,82 @@ class OptimizationRunner:
         result = optimizer.optimize(force, fixed_dofs, callback=callback)
         
         # Generate results
-        return {
+        results = {
             "converged": result.converged,
             "iterations": result.iterations,
             "final_volume_fraction": float(result.volume_fraction),
             "final_compliance": float(result.compliance),
             "mass_reduction": round((1 - result.volume_fraction) * 100, 1),
-            "convergence_history": [float(c) for c in convergence_history],
-            "density_field": result.densities.tolist(),
-            "mesh_elements": nelx * nely * (nelz if optimizer.is_3d else 1),
-            "mesh_dimensions": {"nelx": nelx, "nely": nely, "nelz": nelz if optimizer.is_3d else 1},
+            "convergence_history": np.asarray(convergence_history, dtype=np.float32),
+            "mesh_elements": n_elements,
+            "mesh_dimensions": {"nelx": nelx, "nely": nely, "nelz": mesh_nelz},
             "constraint_violations": result.constraint_violations,
         }
+        if full:
+            results["density_field"] = result.densities.astype(np.float32, copy=False)
+            results["density_field_shape"] = result.densities.shape
+        return results
+
+
+def _run_simp_in_worker(
+    runner: OptimizationRunner,
+    args: Tuple[Any, ...],
+    progress_queue: Optional[Any],
+    report_every: int,
+    full: bool = True,
+) -> Dict[str, Any]:
+    """Run SIMP in a worker process, reporting progress through a queue.
+    
+    Args:
+        runner: Optimization runner to execute
+        args: Positional arguments for OptimizationRunner.run_simp
+        progress_queue: Optional cross-process queue for progress tuples
+        report_every: Report progress every N iterations
+        full: Return the density field along with the metrics
+        
+    Returns:
+        Optimization results
+    """
+    def report(iteration, compliance, metrics):
+        if progress_queue is not None and iteration % report_every == 0:
+            progress_queue.put(
+                (iteration, float(compliance), float(metrics.get("volume_fraction", 0)))
+            )
+    
+    return runner.run_simp(*args, progress_callback=report, full=full)
+
+
+# Static part of every exported chassis GLTF; only accessors, buffer
+# views and buffers vary per mesh. Never mutated, so exports share it.
+_GLTF_TEMPLATE: Final[Dict[str, Any]] = {
+    "asset": {
+        "version": "2.0",
+        "generator": "Trophy Truck Chassis Optimizer"
+    },
+    "scene": 0,
+    "scenes": [{"nodes": [0]}],
+    "nodes": [{"mesh": 0, "name": "OptimizedChassis"}],
+    "meshes": [{
+        "name": "Chassis",
+        "primitives": [{
+            "attributes": {"POSITION": 0},
+            "indices": 1,
+            "material": 0
+        }]
+    }],
+    "materials": [{
+        "name": "CarbonFiber",
+        "pbrMetallicRoughness": {
+            "baseColorFactor": [0.15, 0.15, 0.15, 1.0],
+            "metallicFactor": 0.9,
+            "roughnessFactor": 0.2
+        }
+    }],
+}
 
+# Buffer size above which models are written as a single binary .glb
+# instead of a .gltf with an external .bin buffer
+_GLB_MIN_BYTES = 1 << 20
 
 class ProjectOrchestrator:
     """Orchestrates the complete optimization pipeline."""
@@ -547,7 +609,7 @@ class ProjectOrchestrator:
         Args:
             output_dir: Directory for output files
         """
-        self.output_dir = output_dir
+        self.output_dir = _ensure_dir(output_dir)
         self.load_inference = LoadInferenceService()
         self.design_builder = DesignSpaceBuilder()
         self.opt_runner = OptimizationRunner(output_dir)
@@ -555,8 +617,34 @@ class ProjectOrchestrator:
         self.cfd_solver = CFDSolver(CFDConfig())
         self.mfg_validator = ManufacturingValidator()
         
-        import os
-        os.makedirs(output_dir, exist_ok=True)
+        # Worker processes are started on first use
+        self._pool = None
+        self._manager = None
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        """Return the optimization worker pool, starting it if needed."""
+        if self._pool is None:
+            spawn = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=spawn)
+        return self._pool
+    
+    def _progress_queue(self) -> Any:
+        """Create a queue that an optimization worker process can report through."""
+        if self._manager is None:
+            self._manager = multiprocessing.get_context("spawn").Manager()
+        return self._manager.Queue()
+    
+    def shutdown(self) -> None:
+        """Stop the optimization worker processes.
+        
+        The orchestrator stays usable: the next run starts a new pool.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
     
     async def run_full_pipeline(
         self,
@@ -582,19 +670,20 @@ class ProjectOrchestrator:
             message="Starting pipeline",
             artifacts={},
             metrics={},
-            started_at=datetime.utcnow()
+            started_at=datetime.now(timezone.utc)
         )
+        # Wall-clock timestamps are for display; durations use the monotonic clock
+        pipeline_t0 = time.monotonic()
+        report = progress_callback if progress_callback is not None else lambda _state: None
         
-        if progress_callback:
-            progress_callback(state)
+        report(state)
         
         try:
             # Stage 1: Parse rules
             state.stage = PipelineStage.PARSING_RULES
             state.progress = 10
             state.message = "Parsing rules configuration"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             
             rules_config = project_data.get("rules_config") or {
                 "rule_set_version": "2024",
@@ -609,8 +698,7 @@ class ProjectOrchestrator:
             state.stage = PipelineStage.DESIGN_SPACE
             state.progress = 20
             state.message = "Building design space"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             
             design_space = project_data.get("design_space_config")
             if not design_space or not design_space.get("design_volume"):
@@ -623,8 +711,7 @@ class ProjectOrchestrator:
             state.stage = PipelineStage.LOADS
             state.progress = 30
             state.message = "Inferring load cases"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             
             load_cases = project_data.get("load_cases")
             if not load_cases or not load_cases.get("load_cases"):
@@ -638,8 +725,7 @@ class ProjectOrchestrator:
             state.stage = PipelineStage.MATERIALS
             state.progress = 40
             state.message = "Assigning materials"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             
             materials_config = project_data.get("materials_config") or {
                 "primary_material": "carbon_fiber_t700",
@@ -650,8 +736,7 @@ class ProjectOrchestrator:
             state.stage = PipelineStage.OPTIMIZING
             state.progress = 50
             state.message = "Running topology optimization"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             
             optimization_params = project_data.get("optimization_params") or {
                 "method": "simp",
@@ -660,89 +745,111 @@ class ProjectOrchestrator:
                 "max_iterations": 200,
             }
             
-            def opt_progress(iteration, compliance, metrics):
+            # SIMP runs in a worker process so it neither blocks the event loop
+            # nor contends for the GIL. The worker pushes throttled progress
+            # tuples into a cross-process queue; a consumer task drains it and
+            # forwards the latest update to the caller.
+            loop = asyncio.get_running_loop()
+            total_iterations = optimization_params.get("max_iterations", 200)
+            report_every = max(1, total_iterations // 50)
+            progress_queue = self._progress_queue() if progress_callback else None
+            opt_t0 = time.monotonic()
+            
+            def opt_progress(iteration, compliance, volume_fraction):
+                elapsed = time.monotonic() - opt_t0
                 state.current_iteration = iteration
-                state.total_iterations = optimization_params.get("max_iterations", 200)
+                state.total_iterations = total_iterations
                 state.progress = 50 + (iteration / state.total_iterations) * 20
                 state.metrics["compliance"] = compliance
-                state.metrics["volume_fraction"] = metrics.get("volume_fraction", 0)
-                if progress_callback:
-                    progress_callback(state)
-            
-            opt_results = self.opt_runner.run_simp(
-                design_space,
-                load_cases,
-                materials_config,
-                optimization_params,
-                project_data.get("manufacturing_config"),
-                progress_callback=opt_progress
-            )
+                state.metrics["volume_fraction"] = volume_fraction
+                state.metrics["optimization_elapsed_s"] = elapsed
+                state.metrics["optimization_eta_s"] = (
+                    elapsed / iteration * max(0, total_iterations - iteration)
+                )
+                report(state)
             
-            # Stage 6: Run verification (FE/CFD)
+            async def drain_progress() -> None:
+                done = False
+                while not done:
+                    updates = [await asyncio.to_thread(progress_queue.get)]
+                    # Coalesce: if the callback fell behind, keep only the latest
+                    while not progress_queue.empty():
+                        updates.append(progress_queue.get_nowait())
+                    done = updates[-1] is None  # The sentinel is always last
+                    updates = [u for u in updates if u is not None]
+                    if updates:
+                        opt_progress(*updates[-1])
+            
+            consumer = asyncio.create_task(drain_progress()) if progress_queue is not None else None
+            try:
+                opt_results = await loop.run_in_executor(
+                    self._executor(),
+                    _run_simp_in_worker,
+                    self.opt_runner,
+                    (
+                        design_space,
+                        load_cases,
+                        materials_config,
+                        optimization_params,
+                        project_data.get("manufacturing_config"),
+                    ),
+                    progress_queue,
+                    report_every,
+                )
+            finally:
+                if consumer is not None:
+                    progress_queue.put(None)
+                    await consumer
+            
+            state.metrics["compliance"] = opt_results["final_compliance"]
+            state.metrics["volume_fraction"] = opt_results["final_volume_fraction"]
+            
+            # Stages 6-7: FE, CFD and manufacturing checks only read the
+            # optimization results, so they run concurrently, and so does
+            # the GLTF export of the density field
             state.stage = PipelineStage.VERIFYING
             state.progress = 75
-            state.message = "Running verification analyses"
-            if progress_callback:
-                progress_callback(state)
-            
-            # Simplified verification results (deterministic mock values)
-            # In production, these would come from actual FE/CFD analysis
-            fe_results = {
-                "max_displacement_mm": 4.2,
-                "max_stress_mpa": 205.0,
-                "safety_factor": 2.05,
-                "first_mode_hz": 55.3,
-                "passed": True
-            }
+            state.message = "Running verification and manufacturing analyses"
+            report(state)
             
-            cfd_results = {
-                "drag_coefficient": 0.57,
-                "lift_coefficient": 0.15,
-                "drag_force_n": 1380.0,
-                "passed": True
-            }
+            fe_results, cfd_results, manufacturing_results, gltf_path = await asyncio.gather(
+                asyncio.to_thread(self._run_fe, opt_results),
+                asyncio.to_thread(self._run_cfd, opt_results),
+                asyncio.to_thread(self._run_mfg, opt_results),
+                asyncio.to_thread(
+                    self._generate_gltf_model,
+                    project_id,
+                    opt_results.get("density_field"),
+                    opt_results.get("mesh_dimensions", {}),
+                ),
+            )
             
-            # Stage 7: Manufacturing validation
             state.stage = PipelineStage.MANUFACTURING
             state.progress = 85
-            state.message = "Validating manufacturing constraints"
-            if progress_callback:
-                progress_callback(state)
-            
-            manufacturing_results = {
-                "drapability_valid": True,
-                "max_shear_angle_deg": 40.5,
-                "ply_rules_valid": True,
-                "mold_manufacturable": True,
-                "violations": [],
-                "passed": True
-            }
+            state.message = "Verification and manufacturing validation complete"
+            report(state)
             
-            # Stage 8: Generate outputs
+            # Stage 8: Generate outputs (the GLTF model was exported above)
             state.stage = PipelineStage.OUTPUTS
             state.progress = 90
             state.message = "Generating output files"
-            if progress_callback:
-                progress_callback(state)
-            
-            # Generate GLTF model
-            gltf_path = self._generate_gltf_model(
-                project_id,
-                opt_results.get("density_field", []),
-                opt_results.get("mesh_dimensions", {}),
-            )
+            report(state)
             
             state.artifacts["gltf_model"] = gltf_path
-            state.artifacts["viewer_model_url"] = f"/static/models/{project_id}/optimized.gltf"
+            state.artifacts["viewer_model_url"] = (
+                f"/static/models/{project_id}/{os.path.basename(gltf_path)}"
+            )
             
             # Stage 9: Complete
             state.stage = PipelineStage.COMPLETE
             state.progress = 100
             state.message = "Pipeline completed successfully"
-            state.completed_at = datetime.utcnow()
-            if progress_callback:
-                progress_callback(state)
+            state.completed_at = datetime.now(timezone.utc)
+            state.metrics["pipeline_duration_s"] = time.monotonic() - pipeline_t0
+            report(state)
             
+            # NumPy arrays in the results are written as-is by the orjson
+            # serializer at the database/response boundary
             return {
                 "status": "completed",
                 "optimization_results": opt_results,
@@ -759,31 +866,153 @@ class ProjectOrchestrator:
             state.stage = PipelineStage.FAILED
             state.error = str(e)
             state.message = f"Pipeline failed: {str(e)}"
-            if progress_callback:
-                progress_callback(state)
+            report(state)
             raise
     
+    async def run_optimization_sweep(
+        self,
+        project_id: str,
+        design_space: Dict[str, Any],
+        load_cases: Dict[str, Any],
+        materials_config: Dict[str, Any],
+        param_sets: List[Dict[str, Any]],
+        manufacturing_config: Optional[Dict[str, Any]] = None,
+        full: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Run SIMP for several optimization parameter sets in parallel.
+        
+        The runs are independent, so all of them are submitted to the worker
+        pool at once. Each run writes its model to its own subdirectory of
+        the project.
+        
+        Args:
+            project_id: Project identifier
+            design_space: Design space configuration
+            load_cases: Load cases configuration
+            materials_config: Material configuration
+            param_sets: Optimization parameters for each run
+            manufacturing_config: Manufacturing constraints
+            full: Return density fields and generate a model per run. Set
+                to False when only convergence metrics are needed, e.g.
+                when screening parameters
+            
+        Returns:
+            One result per parameter set, in order, with its optimization
+            results and, when full, its generated model path
+        """
+        loop = asyncio.get_running_loop()
+        runs = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor(),
+                _run_simp_in_worker,
+                self.opt_runner,
+                (design_space, load_cases, materials_config, params, manufacturing_config),
+                None,
+                1,
+                full,
+            )
+            for params in param_sets
+        ))
+        
+        if not full:
+            return [
+                {"optimization_params": params, "optimization_results": opt_results}
+                for params, opt_results in zip(param_sets, runs)
+            ]
+        
+        # Each model goes to its own file, so the exports run concurrently
+        gltf_paths = await asyncio.gather(*(
+            asyncio.to_thread(
+                self._generate_gltf_model,
+                os.path.join(project_id, f"sweep_{i}"),
+                opt_results.get("density_field"),
+                opt_results.get("mesh_dimensions", {}),
+            )
+            for i, opt_results in enumerate(runs)
+        ))
+        return [
+            {
+                "optimization_params": params,
+                "optimization_results": opt_results,
+                "gltf_model": gltf_path,
+            }
+            for params, opt_results, gltf_path in zip(param_sets, runs, gltf_paths)
+        ]
+    
+    def _run_fe(self, opt_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Run structural verification of the optimized design.
+        
+        Args:
+            opt_results: Optimization results
+            
+        Returns:
+            FE verification results
+        """
+        # Simplified verification results (deterministic mock values)
+        # In production, these would come from actual FE analysis
+        return {
+            "max_displacement_mm": 4.2,
+            "max_stress_mpa": 205.0,
+            "safety_factor": 2.05,
+            "first_mode_hz": 55.3,
+            "passed": True
+        }
+    
+    def _run_cfd(self, opt_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Run aerodynamic verification of the optimized design.
+        
+        Args:
+            opt_results: Optimization results
+            
+        Returns:
+            CFD verification results
+        """
+        # In production, these would come from actual CFD analysis
+        return {
+            "drag_coefficient": 0.57,
+            "lift_coefficient": 0.15,
+            "drag_force_n": 1380.0,
+            "passed": True
+        }
+    
+    def _run_mfg(self, opt_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate manufacturing constraints for the optimized design.
+        
+        Args:
+            opt_results: Optimization results
+            
+        Returns:
+            Manufacturing validation results
+        """
+        # In production, these would come from the manufacturing validator
+        return {
+            "drapability_valid": True,
+            "max_shear_angle_deg": 40.5,
+            "ply_rules_valid": True,
+            "mold_manufacturable": True,
+            "violations": [],
+            "passed": True
+        }
+    
     def _generate_gltf_model(
         self,
         project_id: str,
-        density_field: List[float],
+        density_field: Optional[np.ndarray],
         mesh_dims: Dict[str, int],
+        binary: Optional[bool] = None,
     ) -> str:
         """Generate a GLTF model from the density field.
         
         Args:
             project_id: Project identifier
-            density_field: Density values per element
+            density_field: Density values per element (flat or shaped ndarray)
             mesh_dims: Mesh dimensions
+            binary: Write a single binary .glb instead of a .gltf with an
+                external .bin buffer; by default only for large meshes
             
         Returns:
-            Path to generated GLTF file
+            Path to generated GLTF/GLB file
         """
-        import json
-        import os
-        import base64
-        import struct
-        
         project_dir = os.path.join(self.output_dir, project_id)
         os.makedirs(project_dir, exist_ok=True)
         
@@ -794,130 +1023,54 @@ class ProjectOrchestrator:
         
         # Generate mesh vertices and faces
         threshold = 0.3
-        vertices = []
-        indices = []
         
-        # Simple voxel-based geometry (for demo)
-        # In production, would use marching cubes
-        density = np.array(density_field) if density_field else np.random.random(nelx * nely * nelz) * 0.6 + 0.2
+        if density_field is None:
+            density_field = np.random.random(nelx * nely * nelz) * 0.6 + 0.2
         
-        if len(density) < nelx * nely * nelz:
-            density = np.random.random(nelx * nely * nelz) * 0.6 + 0.2
-        
-        density_3d = density.reshape((nelz, nelx, nely)) if len(density) == nelx * nely * nelz else np.random.random((nelz, nelx, nely))
+        density_3d = density_field.reshape((nelz, nelx, nely))
         
         # Scale factors
         scale_x = 3000 / nelx  # mm
         scale_y = 2000 / nely
         scale_z = 1500 / nelz
         
-        vertex_count = 0
-        
-        # Generate boxes for high-density elements
-        for k in range(nelz):
-            for i in range(nelx):
-                for j in range(nely):
-                    if density_3d[k, i, j] > threshold:
-                        # Add a box
-                        x0 = i * scale_x / 1000  # Convert to meters for GLTF
-                        y0 = j * scale_y / 1000
-                        z0 = k * scale_z / 1000
-                        dx = scale_x / 1000 * 0.9  # Slight gap
-                        dy = scale_y / 1000 * 0.9
-                        dz = scale_z / 1000 * 0.9
-                        
-                        # 8 vertices of the box
-                        box_verts = [
-                            [x0, y0, z0],
-                            [x0 + dx, y0, z0],
-                            [x0 + dx, y0 + dy, z0],
-                            [x0, y0 + dy, z0],
-                            [x0, y0, z0 + dz],
-                            [x0 + dx, y0, z0 + dz],
-                            [x0 + dx, y0 + dy, z0 + dz],
-                            [x0, y0 + dy, z0 + dz],
-                        ]
-                        
-                        vertices.extend(box_verts)
-                        
-                        # 12 triangles (6 faces * 2 triangles)
-                        base = vertex_count
-                        box_indices = [
-                            # Front
-                            base, base + 1, base + 5, base, base + 5, base + 4,
-                            # Back
-                            base + 2, base + 3, base + 7, base + 2, base + 7, base + 6,
-                            # Top
-                            base + 4, base + 5, base + 6, base + 4, base + 6, base + 7,
-                            # Bottom
-                            base, base + 3, base + 2, base, base + 2, base + 1,
-                            # Right
-                            base + 1, base + 2, base + 6, base + 1, base + 6, base + 5,
-                            # Left
-                            base, base + 4, base + 7, base, base + 7, base + 3,
-                        ]
-                        indices.extend(box_indices)
-                        vertex_count += 8
-        
-        # Ensure we have at least some geometry
-        if not vertices:
-            # Create a default chassis shape
-            vertices = [
-                [0, 0, 0], [3, 0, 0], [3, 2, 0], [0, 2, 0],
-                [0, 0, 1.5], [3, 0, 1.5], [3, 2, 1.5], [0, 2, 1.5],
-            ]
-            indices = [
-                0, 1, 5, 0, 5, 4,  # Front
-                2, 3, 7, 2, 7, 6,  # Back
-                4, 5, 6, 4, 6, 7,  # Top
-                0, 3, 2, 0, 2, 1,  # Bottom
-                1, 2, 6, 1, 6, 5,  # Right
-                0, 4, 7, 0, 7, 3,  # Left
-            ]
-        
-        # Create binary data for vertices and indices
-        vertex_data = b''
-        for v in vertices:
-            vertex_data += struct.pack('fff', v[0], v[1], v[2])
+        # Prefer a marching-cubes isosurface; fall back to voxel faces
+        surface = self._marching_cubes_surface(
+            density_3d, threshold, (scale_z, scale_x, scale_y)
+        )
+        if surface is not None:
+            vertices, indices = surface
+        else:
+            vertices, indices = self._voxel_boxes(
+                density_3d, threshold, (scale_x, scale_y, scale_z)
+            )
         
-        index_data = b''
-        for idx in indices:
-            index_data += struct.pack('H', idx)
+        # Use 16-bit indices whenever every vertex is addressable by them
+        if len(vertices) <= 0xFFFF:
+            index_dtype = np.dtype("<u2")
+            index_component_type = 5123  # UNSIGNED_SHORT
+        else:
+            index_dtype = np.dtype("<u4")
+            index_component_type = 5125  # UNSIGNED_INT
         
-        # Calculate bounds
-        vertices_np = np.array(vertices)
-        min_bounds = vertices_np.min(axis=0).tolist() if len(vertices_np) > 0 else [0, 0, 0]
-        max_bounds = vertices_np.max(axis=0).tolist() if len(vertices_np) > 0 else [3, 2, 1.5]
+        # Pack vertices and indices straight into one preallocated buffer;
+        # each view starts on a 4-byte boundary as GLTF requires
+        vertex_length = vertices.size * 4
+        index_offset = -(-vertex_length // 4) * 4
+        index_length = indices.size * index_dtype.itemsize
+        buffer_data = bytearray(index_offset + -(-index_length // 4) * 4)
+        np.frombuffer(buffer_data, dtype="<f4", count=vertices.size)[:] = vertices.ravel()
+        np.frombuffer(
+            buffer_data, dtype=index_dtype, count=indices.size, offset=index_offset
+        )[:] = indices
         
-        # Encode as base64 for embedded GLTF
-        buffer_data = vertex_data + index_data
-        buffer_b64 = base64.b64encode(buffer_data).decode('ascii')
+        # Calculate bounds from the float32 vertex array
+        min_bounds = vertices.min(axis=0).tolist()
+        max_bounds = vertices.max(axis=0).tolist()
         
-        # Build GLTF structure
+        # Fill the per-mesh accessors and buffers into the shared scaffolding
         gltf = {
-            "asset": {
-                "version": "2.0",
-                "generator": "Trophy Truck Chassis Optimizer"
-            },
-            "scene": 0,
-            "scenes": [{"nodes": [0]}],
-            "nodes": [{"mesh": 0, "name": "OptimizedChassis"}],
-            "meshes": [{
-                "name": "Chassis",
-                "primitives": [{
-                    "attributes": {"POSITION": 0},
-                    "indices": 1,
-                    "material": 0
-                }]
-            }],
-            "materials": [{
-                "name": "CarbonFiber",
-                "pbrMetallicRoughness": {
-                    "baseColorFactor": [0.15, 0.15, 0.15, 1.0],
-                    "metallicFactor": 0.9,
-                    "roughnessFactor": 0.2
-                }
-            }],
+            **_GLTF_TEMPLATE,
             "accessors": [
                 {
                     "bufferView": 0,
@@ -929,7 +1082,7 @@ class ProjectOrchestrator:
                 },
                 {
                     "bufferView": 1,
-                    "componentType": 5123,  # UNSIGNED_SHORT
+                    "componentType": index_component_type,
                     "count": len(indices),
                     "type": "SCALAR"
                 }
@@ -938,25 +1091,142 @@ class ProjectOrchestrator:
                 {
                     "buffer": 0,
                     "byteOffset": 0,
-                    "byteLength": len(vertex_data),
+                    "byteLength": vertex_length,
                     "target": 34962  # ARRAY_BUFFER
                 },
                 {
                     "buffer": 0,
-                    "byteOffset": len(vertex_data),
-                    "byteLength": len(index_data),
+                    "byteOffset": index_offset,
+                    "byteLength": index_length,
                     "target": 34963  # ELEMENT_ARRAY_BUFFER
                 }
             ],
             "buffers": [{
-                "uri": f"data:application/octet-stream;base64,{buffer_b64}",
                 "byteLength": len(buffer_data)
             }]
         }
         
+        if binary is None:
+            binary = len(buffer_data) >= _GLB_MIN_BYTES
+        if binary:
+            return self._export_glb(
+                gltf, buffer_data, os.path.join(project_dir, "optimized.glb")
+            )
+        
+        # Write the buffer next to the GLTF and reference it by relative URI
+        with open(os.path.join(project_dir, "optimized.bin"), 'wb') as f:
+            f.write(buffer_data)
+        gltf["buffers"][0]["uri"] = "optimized.bin"
+        
         # Write GLTF file
         gltf_path = os.path.join(project_dir, "optimized.gltf")
-        with open(gltf_path, 'w') as f:
-            json.dump(gltf, f, indent=2)
+        with open(gltf_path, 'wb') as f:
+            f.write(orjson.dumps(gltf))
         
         return gltf_path
+    
+    def _export_glb(
+        self, gltf: Dict[str, Any], buffer_data: bytes, glb_path: str
+    ) -> str:
+        """Write a binary GLTF container (header, JSON chunk, BIN chunk).
+        
+        Args:
+            gltf: GLTF document whose single buffer has no ``uri``
+            buffer_data: Binary buffer referenced by the document
+            glb_path: Output file path
+            
+        Returns:
+            Path to generated GLB file
+        """
+        json_chunk = orjson.dumps(gltf)
+        json_chunk += b" " * (-len(json_chunk) % 4)
+        bin_padding = b"\x00" * (-len(buffer_data) % 4)
+        bin_length = len(buffer_data) + len(bin_padding)
+        total_length = 12 + 8 + len(json_chunk) + 8 + bin_length
+        
+        with open(glb_path, "wb") as f:
+            f.write(struct.pack("<III", 0x46546C67, 2, total_length))  # "glTF"
+            f.write(struct.pack("<II", len(json_chunk), 0x4E4F534A))  # "JSON"
+            f.write(json_chunk)
+            f.write(struct.pack("<II", bin_length, 0x004E4942))  # "BIN"
+            f.write(buffer_data)
+            f.write(bin_padding)
+        
+        return glb_path
+    
+    def _marching_cubes_surface(
+        self,
+        density_3d: np.ndarray,
+        threshold: float,
+        spacing_mm: Tuple[float, float, float],
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Extract the density isosurface with marching cubes (if available).
+        
+        Args:
+            density_3d: Density grid indexed as (z, x, y)
+            threshold: Iso-level separating solid from void
+            spacing_mm: Element size along (z, x, y) in mm
+            
+        Returns:
+            Tuple of (float32 vertices in GLTF x/y/z meters, flat uint32
+            indices), or None if scikit-image is unavailable or the field
+            has no surface at the threshold
+        """
+        try:
+            from skimage.measure import marching_cubes
+        except ImportError:
+            return None
+        
+        # Pad with void so the surface is closed at the domain boundary
+        padded = np.pad(density_3d, 1, mode="constant", constant_values=0.0)
+        solid = padded > threshold
+        if not solid.any():
+            return None
+        
+        # Only cubes next to a solid sample can cross the iso-level, so march
+        # over the occupied box plus one void sample on each side
+        box = tuple(slice(b.start - 1, b.stop + 1) for b in occupied_box(solid))
+        
+        spacing = tuple(s / 1000 for s in spacing_mm)  # Convert to meters for GLTF
+        verts, faces, _normals, _values = marching_cubes(
+            padded[box], level=threshold, spacing=spacing
+        )
+        verts += [(b.start - 1) * s for b, s in zip(box, spacing)]
+        
+        # (z, x, y) -> (x, y, z); a cyclic permutation keeps the winding order
+        vertices = np.ascontiguousarray(verts[:, [1, 2, 0]], dtype="<f4")
+        indices = np.ascontiguousarray(faces, dtype="<u4").ravel()
+        return vertices, indices
+    
+    def _voxel_boxes(
+        self,
+        density_3d: np.ndarray,
+        threshold: float,
+        scale_mm: Tuple[float, float, float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Build the boundary faces of the solid voxels (fallback without
+        marching cubes).
+        
+        Faces shared by two solid voxels are interior and skipped, and
+        corners shared by neighboring faces are emitted once.
+        
+        Args:
+            density_3d: Density grid indexed as (z, x, y)
+            threshold: Density above which a voxel is solid
+            scale_mm: Element size along (x, y, z) in mm
+            
+        Returns:
+            Tuple of (float32 vertices of shape (n_vertices, 3), flat
+            uint32 triangle indices)
+        """
+        scale = np.asarray(scale_mm, dtype=np.float32) / 1000  # Convert to meters for GLTF
+        
+        solid = (density_3d > threshold).transpose(1, 2, 0)  # (x, y, z)
+        corners, triangles = voxel_surface(solid)
+        if not len(triangles):
+            # Create a default chassis shape
+            corners, triangles = voxel_surface(np.ones((1, 1, 1), dtype=bool))
+            return (corners * [3, 2, 1.5]).astype(np.float32), triangles.ravel()
+        
+        vertices = corners.astype(np.float32) * scale
+        return vertices, triangles.ravel()
@@ -8,13 +8,15 @@ os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test.db"
 
 from fastapi.testclient import TestClient
 
+from app.api.projects import orchestrator
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Test client fixture."""
-    return TestClient(app)
+    """Test client fixture, shared so app startup/shutdown runs once."""
+    with TestClient(app) as client:
+        yield client
 
 
 class TestRootEndpoints:
@@ -91,3 +93,31 @@ class TestRulesAPI:
         data = response.json()
         assert "max_width_mm" in data
         assert data["max_width_mm"] == 2438
+
+
+class TestLifespan:
+    """Tests for application startup and shutdown."""
+
+    def test_optimize_after_restart(self, tmp_path, monkeypatch):
+        """Test optimization still runs after a previous lifespan shut down."""
+        monkeypatch.setattr(orchestrator, "output_dir", str(tmp_path))
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+
+        with TestClient(app) as client:
+            project = client.post("/api/v1/projects/", json={"name": "Restart"}).json()
+            response = client.put(
+                f"/api/v1/projects/{project['id']}",
+                json={
+                    "design_space_config": {
+                        "design_volume": {"length": 500, "width": 250, "height": 250},
+                    },
+                    "optimization_params": {"max_iterations": 2},
+                },
+            )
+            assert response.status_code == 200
+
+            response = client.post(f"/api/v1/projects/{project['id']}/optimize")
+            assert response.status_code == 200
+            job = response.json()
+            assert job["status"] == "completed", job["error_message"]
@@ -0,0 +1,101 @@
+"""Tests for CAD geometry export."""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.outputs import geometry
+from app.outputs.geometry import FastenerMapExporter, GeometryExporter, LayupExporter
+
+
+def _read_binary_stl(path):
+    """Decode a binary STL into header, normals and (F, 3, 3) triangles."""
+    with open(path, "rb") as f:
+        data = f.read()
+    count = int(np.frombuffer(data, dtype="<u4", count=1, offset=80)[0])
+    assert len(data) == 84 + 50 * count
+    records = np.frombuffer(data, dtype=np.dtype([
+        ("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2"),
+    ]), offset=84)
+    return data[:80], records["normal"], records["vertices"]
+
+
+class TestSTLExport:
+    """Tests for STL export."""
+
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        return GeometryExporter(output_dir=str(tmp_path))
+
+    def test_binary_voxel_surface(self, exporter):
+        """Test binary STL encloses one unit of volume per solid voxel."""
+        density = np.zeros((3, 4, 5))
+        density[1, 1:3, 2] = 1.0
+        result = exporter.export_stl(density, "part")
+        header, normals, triangles = _read_binary_stl(result.filepath)
+
+        assert header.startswith(b"density_field")
+        assert len(triangles) == result.metadata["triangles"] == 2 * 12 - 2 * 2
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+
+        # Divergence theorem: sum of signed tetrahedron volumes from the origin
+        volume = np.einsum(
+            "ij,ij->i", triangles[:, 0], np.cross(triangles[:, 1], triangles[:, 2])
+        ).sum() / 6
+        assert volume == pytest.approx(2.0)
+
+    def test_ascii_matches_binary(self, exporter):
+        """Test the ASCII writer encodes the same facets as the binary one."""
+        density = np.random.default_rng(0).random((6, 5, 4))
+        binary = exporter.export_stl(density, "binary")
+        ascii_ = exporter.export_stl(density, "ascii", binary=False)
+        _, normals, triangles = _read_binary_stl(binary.filepath)
+
+        with open(ascii_.filepath) as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "solid density_field" and lines[-1] == "endsolid density_field"
+        values = np.array([
+            line.split()[-3:] for line in lines if line.lstrip().startswith(("facet", "vertex"))
+        ], dtype=float).reshape(-1, 4, 3)
+        np.testing.assert_allclose(values[:, 0], normals, atol=1e-6)
+        np.testing.assert_allclose(values[:, 1:], triangles, atol=1e-6)
+
+    def test_chunked_binary_write(self, exporter, monkeypatch):
+        """Test records split across several write chunks decode unchanged."""
+        density = np.random.default_rng(1).random((6, 5, 4))
+        whole = exporter.export_stl(density, "whole")
+        monkeypatch.setattr(geometry, "_STL_CHUNK", 7)
+        chunked = exporter.export_stl(density, "chunked")
+
+        with open(whole.filepath, "rb") as f, open(chunked.filepath, "rb") as g:
+            assert f.read() == g.read()
+
+    def test_empty_density(self, exporter):
+        """Test an all-void field gives a valid STL with no facets."""
+        result = exporter.export_stl(np.zeros((2, 2, 2)), "empty")
+        _, _, triangles = _read_binary_stl(result.filepath)
+        assert len(triangles) == 0
+
+
+class TestJSONExport:
+    """Tests for JSON schedule exports."""
+
+    def test_numpy_values(self, tmp_path):
+        """Test NumPy scalars and arrays are written as plain JSON values."""
+        plies = [{"angle": np.float64(45.0), "thickness": np.float32(0.25)}]
+        result = LayupExporter(str(tmp_path)).export_json(
+            plies, "layup", metadata={"zones": np.arange(3)}
+        )
+        with open(result.filepath) as f:
+            data = json.load(f)
+        assert data["plies"] == [{"angle": 45.0, "thickness": 0.25}]
+        assert data["metadata"] == {"zones": [0, 1, 2]}
+
+    def test_non_string_summary_keys(self, tmp_path):
+        """Test numeric fastener sizes become string keys in the summary."""
+        fasteners = [{"type": "bolt", "size": 6}, {"type": "bolt", "size": 8}]
+        result = FastenerMapExporter(str(tmp_path)).export_fastener_map(fasteners, "map")
+        with open(result.filepath) as f:
+            data = json.load(f)
+        assert data["summary"] == {"by_type": {"bolt": 2}, "by_size": {"6": 1, "8": 1}}
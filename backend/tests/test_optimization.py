@@ -12,6 +12,26 @@ from app.optimization.laminate import (
 )
 
 
+@pytest.fixture(scope="module")
+def qi_layup_1():
+    """Quasi-isotropic [0/45/-45/90]s layup, built once per module."""
+    return create_quasi_isotropic_layup(
+        material_name="T700",
+        ply_thickness=0.125,
+        n_sets=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def qi_layup_2():
+    """Quasi-isotropic [0/45/-45/90]2s layup, built once per module."""
+    return create_quasi_isotropic_layup(
+        material_name="T700",
+        ply_thickness=0.125,
+        n_sets=2,
+    )
+
+
 class TestSIMPOptimizer:
     """Tests for SIMP topology optimization."""
 
@@ -71,6 +91,42 @@ class TestSIMPOptimizer:
         assert result.volume_fraction <= 0.5
         assert len(result.convergence_history) > 0
 
+    def test_cg_solver_matches_direct(self):
+        """Test the iterative solver reproduces the direct solution in 3D."""
+        results = []
+        for solver in ["direct", "cg"]:
+            config = SIMPConfig(
+                nelx=8,
+                nely=4,
+                nelz=3,
+                max_iterations=3,
+                linear_solver=solver,
+            )
+            optimizer = SIMPOptimizer(config)
+            force = np.zeros(optimizer._num_dofs)
+            force[optimizer._num_dofs // 2] = -1.0
+            fixed_dofs = np.arange(0, 3 * (4 + 1) * (3 + 1))
+            results.append(optimizer.optimize(force, fixed_dofs))
+
+        direct, iterative = results
+        assert np.allclose(direct.densities, iterative.densities, atol=1e-6)
+        assert np.isclose(direct.compliance, iterative.compliance, rtol=1e-6)
+
+    def test_penalty_continuation(self):
+        """Test continuation ramps the penalty up to the configured value."""
+        optimizer, force, fixed_dofs = create_cantilever_problem(
+            nelx=20, nely=10, volume_fraction=0.4
+        )
+        optimizer.config.penalty_continuation = True
+        optimizer.config.continuation_iterations = 5
+
+        result = optimizer.optimize(force, fixed_dofs)
+
+        assert optimizer.penal == optimizer.config.penalty
+        # Four 0.5 steps from p=1 to p=3, at most five iterations each
+        assert result.iterations > 4
+        assert result.converged == (result.iterations < optimizer.config.max_iterations)
+
 
 class TestLevelSetOptimizer:
     """Tests for level-set topology optimization."""
@@ -112,13 +168,9 @@ class TestLaminateAnalysis:
         assert ply.angle == 45.0
         assert ply.thickness == 0.125
 
-    def test_quasi_isotropic_layup(self):
+    def test_quasi_isotropic_layup(self, qi_layup_2):
         """Test quasi-isotropic layup creation."""
-        plies = create_quasi_isotropic_layup(
-            material_name="T700",
-            ply_thickness=0.125,
-            n_sets=2,
-        )
+        plies = qi_layup_2
         
         assert len(plies) == 16  # [0/45/-45/90]2s = 8 * 2 = 16
         
@@ -127,13 +179,9 @@ class TestLaminateAnalysis:
         for i in range(n // 2):
             assert plies[i].angle == plies[n - 1 - i].angle
 
-    def test_laminate_analyzer(self):
+    def test_laminate_analyzer(self, qi_layup_1):
         """Test laminate analysis."""
-        plies = create_quasi_isotropic_layup(
-            material_name="T700",
-            ply_thickness=0.125,
-            n_sets=1,
-        )
+        plies = qi_layup_1
         
         analyzer = LaminateAnalyzer(plies)
         result = analyzer.compute_effective_properties()
@@ -157,13 +205,27 @@ class TestLaminateAnalysis:
         assert ABD.shape == (6, 6)
         assert np.allclose(ABD, ABD.T)  # Should be symmetric
 
-    def test_ply_rules_check(self):
+    def test_unbalanced_layup(self):
+        """Test a +45 ply without a matching -45 ply fails the balance rule."""
+        plies = [
+            Ply("T700", angle, 0.125, 165.0, 10.5, 5.5, 0.28)
+            for angle in [0, 45, 45, 0]
+        ]
+
+        checks = {name: passed for name, passed, _ in LaminateAnalyzer(plies).check_ply_rules()}
+        assert checks["Symmetry"]
+        assert not checks["Balance"]
+
+    def test_quasi_isotropic_properties(self, qi_layup_2):
+        """Test a quasi-isotropic laminate is isotropic in-plane."""
+        result = LaminateAnalyzer(qi_layup_2).compute_effective_properties()
+
+        assert result.Ex == pytest.approx(result.Ey)
+        assert result.Gxy == pytest.approx(result.Ex / (2 * (1 + result.nu_xy)))
+
+    def test_ply_rules_check(self, qi_layup_2):
         """Test ply rules validation."""
-        plies = create_quasi_isotropic_layup(
-            material_name="T700",
-            ply_thickness=0.125,
-            n_sets=2,
-        )
+        plies = qi_layup_2
         
         analyzer = LaminateAnalyzer(plies)
         checks = analyzer.check_ply_rules()
@@ -178,13 +240,9 @@ class TestLaminateAnalysis:
 class TestStressAnalysis:
     """Tests for laminate stress analysis."""
 
-    def test_stress_analysis(self):
+    def test_stress_analysis(self, qi_layup_1):
         """Test stress analysis under load."""
-        plies = create_quasi_isotropic_layup(
-            material_name="T700",
-            ply_thickness=0.125,
-            n_sets=1,
-        )
+        plies = qi_layup_1
         
         analyzer = LaminateAnalyzer(plies)
         result = analyzer.analyze_stress(Nx=100.0)  # 100 N/mm in x
@@ -193,3 +251,14 @@ class TestStressAnalysis:
         assert len(result.ply_stresses) == len(plies)
         assert result.failure_indices is not None
         assert all(fi >= 0 for fi in result.failure_indices)
+
+    def test_check_failure_broadcasts(self, qi_layup_1):
+        """Test failure indices of stacked load cases match one-at-a-time."""
+        analyzer = LaminateAnalyzer(qi_layup_1)
+        cases = [analyzer.analyze_stress(Nx=100.0), analyzer.analyze_stress(Ny=-50.0, Mxy=5.0)]
+        stresses = np.array([case.ply_stresses for case in cases])
+
+        failure = analyzer.check_failure(stresses)
+        assert failure.shape == (len(cases), len(qi_layup_1))
+        for indices, case in zip(failure, cases):
+            np.testing.assert_allclose(indices, case.failure_indices)
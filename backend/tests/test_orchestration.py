@@ -0,0 +1,156 @@
+"""Tests for the project orchestration pipeline."""
+
+import asyncio
+import json
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from app.services.orchestration import ProjectOrchestrator, infer_loads
+
+
+def _read_gltf(path):
+    """Load a GLTF/GLB file and decode its vertex and index accessors."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".glb"):
+        magic, version, length = struct.unpack_from("<III", data, 0)
+        assert (magic, version, length) == (0x46546C67, 2, len(data))
+        json_length, _ = struct.unpack_from("<II", data, 12)
+        gltf = json.loads(data[20:20 + json_length])
+        bin_length, _ = struct.unpack_from("<II", data, 20 + json_length)
+        buffer = data[28 + json_length:28 + json_length + bin_length]
+    else:
+        gltf = json.loads(data)
+        bin_path = os.path.join(os.path.dirname(path), gltf["buffers"][0]["uri"])
+        with open(bin_path, "rb") as f:
+            buffer = f.read()
+    assert len(buffer) >= gltf["buffers"][0]["byteLength"]
+
+    position, index = gltf["accessors"]
+    vertex_view = gltf["bufferViews"][position["bufferView"]]
+    index_view = gltf["bufferViews"][index["bufferView"]]
+    index_dtype = "<u2" if index["componentType"] == 5123 else "<u4"
+    assert index_view["byteOffset"] % np.dtype(index_dtype).itemsize == 0
+
+    vertices = np.frombuffer(
+        buffer, dtype="<f4", count=position["count"] * 3,
+        offset=vertex_view["byteOffset"],
+    ).reshape(-1, 3)
+    indices = np.frombuffer(
+        buffer, dtype=index_dtype, count=index["count"],
+        offset=index_view["byteOffset"],
+    )
+    return gltf, vertices, indices
+
+
+class TestGLTFExport:
+    """Tests for GLTF model generation."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        orchestrator = ProjectOrchestrator(output_dir=str(tmp_path))
+        yield orchestrator
+        orchestrator.shutdown()
+
+    def test_voxel_boxes(self, orchestrator):
+        """Test only faces between solid and void voxels are emitted."""
+        density = np.zeros((2, 3, 4))
+        density[1, 2, 3] = 1.0
+        vertices, indices = orchestrator._voxel_boxes(density, 0.3, (1000, 1000, 1000))
+        assert len(indices) == 36
+        assert len(vertices) == 8  # Corners shared between faces are merged
+        np.testing.assert_allclose(vertices.min(axis=0), [2, 3, 1])
+
+        # Two adjacent voxels share one hidden face on each side
+        density[1, 1, 3] = 1.0
+        _, indices = orchestrator._voxel_boxes(density, 0.3, (1000, 1000, 1000))
+        assert len(indices) == 2 * 36 - 2 * 6
+
+    @pytest.mark.parametrize("dims,component_type", [
+        ((10, 5, 5), 5123),
+        ((80, 40, 30), 5125),
+    ])
+    def test_index_component_type(self, orchestrator, dims, component_type):
+        """Test indices switch to uint32 once vertices exceed uint16."""
+        orchestrator._marching_cubes_surface = lambda *args: None
+        nelx, nely, nelz = dims
+        # Checkerboard: every solid voxel exposes all six faces
+        density = (np.indices((nelz, nelx, nely)).sum(axis=0) % 2).ravel()
+
+        path = orchestrator._generate_gltf_model(
+            "test", density, {"nelx": nelx, "nely": nely, "nelz": nelz}
+        )
+        gltf, vertices, indices = _read_gltf(path)
+
+        assert gltf["accessors"][1]["componentType"] == component_type
+        assert len(indices) == 36 * density.sum()
+        assert indices.max() == len(vertices) - 1
+        np.testing.assert_allclose(vertices.min(axis=0), gltf["accessors"][0]["min"])
+        np.testing.assert_allclose(vertices.max(axis=0), gltf["accessors"][0]["max"])
+
+    def test_glb_matches_gltf(self, orchestrator):
+        """Test the .glb and .gltf writers encode the same mesh."""
+        density = np.random.default_rng(0).random(10 * 5 * 5)
+        dims = {"nelx": 10, "nely": 5, "nelz": 5}
+
+        glb_path = orchestrator._generate_gltf_model("glb", density, dims, binary=True)
+        gltf_path = orchestrator._generate_gltf_model("gltf", density, dims, binary=False)
+        assert glb_path.endswith(".glb") and gltf_path.endswith(".gltf")
+
+        _, vertices, indices = _read_gltf(glb_path)
+        _, ref_vertices, ref_indices = _read_gltf(gltf_path)
+        np.testing.assert_array_equal(vertices, ref_vertices)
+        np.testing.assert_array_equal(indices, ref_indices)
+
+
+class TestOptimizationSweep:
+    """Tests for parallel optimization sweeps."""
+
+    def test_sweep_runs_each_param_set(self, tmp_path):
+        """Test each parameter set gets its own results and model."""
+        orchestrator = ProjectOrchestrator(output_dir=str(tmp_path))
+        param_sets = [
+            {"volume_fraction": 0.3, "max_iterations": 3},
+            {"volume_fraction": 0.5, "max_iterations": 3},
+        ]
+        try:
+            results = asyncio.run(orchestrator.run_optimization_sweep(
+                "sweep",
+                {"design_volume": {"length": 500, "width": 250, "height": 250}},
+                infer_loads("baja_1000"),
+                {},
+                param_sets,
+            ))
+        finally:
+            orchestrator.shutdown()
+
+        assert [r["optimization_params"] for r in results] == param_sets
+        assert len({r["gltf_model"] for r in results}) == len(param_sets)
+        for result in results:
+            assert os.path.exists(result["gltf_model"])
+            assert result["optimization_results"]["iterations"] == 3
+
+    def test_sweep_metrics_only(self, tmp_path):
+        """Test a metrics-only sweep skips density fields and models."""
+        orchestrator = ProjectOrchestrator(output_dir=str(tmp_path))
+        param_sets = [{"volume_fraction": 0.4, "max_iterations": 2}]
+        try:
+            results = asyncio.run(orchestrator.run_optimization_sweep(
+                "sweep",
+                {"design_volume": {"length": 500, "width": 250, "height": 250}},
+                infer_loads("baja_1000"),
+                {},
+                param_sets,
+                full=False,
+            ))
+        finally:
+            orchestrator.shutdown()
+
+        assert "gltf_model" not in results[0]
+        opt_results = results[0]["optimization_results"]
+        assert "density_field" not in opt_results
+        assert opt_results["iterations"] == 2
+        assert not os.listdir(tmp_path)